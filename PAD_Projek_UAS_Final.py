@@ -1,89 +1,1298 @@
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from tkcalendar import DateEntry
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import seaborn as sns
+import argparse
+import glob
 import logging
+import sys
+import itertools
+import copy
+import threading
+import functools
+import time
+import tracemalloc
+import cProfile
+import pstats
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from collections import deque, namedtuple
+import io
+import os
+import json
+import hashlib
+import sqlite3
+import weakref
+import re
+from pandas.tseries.api import guess_datetime_format
 
 # Logging untuk debugging
 logging.basicConfig(level=logging.INFO)
 
-# Atur tema seaborn untuk visual yang konsisten
-sns.set_theme(style="darkgrid")
+# Modul GUI dimuat saat dibutuhkan supaya mode batch bisa berjalan tanpa Tkinter
+tk = ttk = filedialog = messagebox = DateEntry = FigureCanvasTkAgg = None
 
-class DataHandler:
-    """Kelas untuk mengelola pemuatan dan praproses data penjualan."""
+
+def load_gui_modules():
+    global tk, ttk, filedialog, messagebox, DateEntry, FigureCanvasTkAgg
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
+    from tkcalendar import DateEntry
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+def apply_theme():
+    # Atur tema seaborn untuk visual yang konsisten
+    import seaborn as sns
+    sns.set_theme(style="darkgrid")
+
+
+def pastel_palette():
+    import seaborn as sns
+    return sns.color_palette("pastel")
+
+# Kolom wajib pada file penjualan
+REQUIRED_COLUMNS = ['tanggal', 'produk', 'jumlah_terjual', 'harga_satuan']
+
+# Mode streaming: jumlah baris per potongan dan ukuran file minimum yang dimuat per potongan
+STREAM_CHUNKSIZE = 200_000
+STREAM_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# Interval pengecekan baris baru pada mode pantau file (ms)
+TAIL_POLL_MS = 5000
+
+# Jeda setelah ketikan terakhir sebelum pencarian produk dijalankan (ms)
+SEARCH_DEBOUNCE_MS = 250
+
+# Interval penyegaran status bar profil (ms) dan jumlah catatan waktu yang disimpan
+STATUS_POLL_MS = 500
+PROFILE_MAX_RECORDS = 10_000
+
+# Galat relatif sketsa kuantil pendapatan (median dan persentil pada ringkasan lengkap)
+SKETCH_ACCURACY = 0.01
+
+# Format teks tanggal di SQLite; lebar tetap sehingga urutan teks sama dengan urutan waktu
+SQL_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Cache kolumnar untuk CSV yang sudah dibersihkan
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pad_penjualan')
+CACHE_MAX_BYTES = 2 * 1024 ** 3
+CACHE_SAMPLE_BYTES = 1024 * 1024
+# Naikkan bila isi frame yang di-cache berubah (kolom atau tipe dari pembersihan dan
+# derive_columns); entri dengan versi lain dianggap tidak ada
+CACHE_VERSION = 2
+
+
+def normalize_column(name):
+    return name.strip().lower().replace(' ', '_')
+
+
+ProfileRecord = namedtuple('ProfileRecord', ['waktu', 'nama', 'detik', 'baris', 'memori', 'thread', 'kedalaman'])
+
+
+def row_count(result, args):
+    """Jumlah baris yang diproses: data milik objek (self), hasil, lalu argumen lain."""
+    for value in (*args[:1], result, *args[1:]):
+        data = value if isinstance(value, (pd.DataFrame, pd.Series)) else getattr(value, 'data', None)
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            return len(data)
+    return None
+
+
+class Profiler:
+    """Mencatat waktu, jumlah baris dan selisih memori setiap pemanggilan yang diinstrumentasi.
+
+    Selisih memori (tracemalloc) dan cProfile hanya aktif setelah configure karena
+    keduanya memperlambat. cProfile hanya merekam panggilan terluar per thread dan
+    hasilnya diakumulasi ke satu pstats.Stats. Aman dipakai dari beberapa thread.
+    """
+    def __init__(self, max_records=PROFILE_MAX_RECORDS):
+        self.records = deque(maxlen=max_records)
+        self.sequence = 0
+        self.memory = False
+        self.cprofile = False
+        self.stats = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def configure(self, memory=None, cprofile=None):
+        if memory is not None:
+            self.memory = memory
+            if memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+            elif not memory and tracemalloc.is_tracing():
+                tracemalloc.stop()
+        if cprofile is not None:
+            self.cprofile = cprofile
+
+    def call(self, name, func, args, kwargs):
+        depth = getattr(self._local, 'depth', 0)
+        profile = cProfile.Profile() if self.cprofile and depth == 0 else None
+        tracing = self.memory and tracemalloc.is_tracing()
+        before = tracemalloc.get_traced_memory()[0] if tracing else None
+        result = None
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            if profile is not None:
+                try:
+                    profile.enable()
+                except ValueError:
+                    # Profiler lain sedang aktif
+                    profile = None
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            if profile is not None:
+                profile.disable()
+            elapsed = time.perf_counter() - start
+            self._local.depth = depth
+            memory = tracemalloc.get_traced_memory()[0] - before if tracing and tracemalloc.is_tracing() else None
+            self.record(name, elapsed, row_count(result, args), memory, depth, profile)
+
+    def record(self, name, seconds, rows=None, memory=None, depth=0, profile=None):
+        with self._lock:
+            self.sequence += 1
+            self.records.append(ProfileRecord(time.time(), name, seconds, rows, memory,
+                                              threading.current_thread().name, depth))
+            if profile is not None:
+                if self.stats is None:
+                    self.stats = pstats.Stats(profile)
+                else:
+                    self.stats.add(profile)
+
+    def last(self):
+        with self._lock:
+            return self.records[-1] if self.records else None
+
+    def frame(self):
+        with self._lock:
+            return pd.DataFrame(list(self.records), columns=ProfileRecord._fields)
+
+    def summary(self):
+        """Total, rata-rata dan maksimum waktu per nama, diurutkan dari yang paling lama."""
+        frame = self.frame()
+        if frame.empty:
+            return frame
+        return (frame.groupby('nama')['detik'].agg(['count', 'sum', 'mean', 'max'])
+                .sort_values('sum', ascending=False))
+
+    def export(self, path):
+        """Tulis catatan waktu (CSV atau JSON menurut ekstensi) dan, bila ada, hasil cProfile ke .prof."""
+        frame = self.frame()
+        frame['waktu'] = pd.to_datetime(frame['waktu'], unit='s')
+        if path.lower().endswith('.json'):
+            frame.to_json(path, orient='records', date_format='iso', indent=2)
+        else:
+            frame.to_csv(path, index=False)
+        written = [path]
+        with self._lock:
+            if self.stats is not None:
+                stats_path = os.path.splitext(path)[0] + '.prof'
+                self.stats.dump_stats(stats_path)
+                written.append(stats_path)
+        return written
+
+    def reset(self):
+        with self._lock:
+            self.records.clear()
+            self.stats = None
+
+
+profiler = Profiler()
+
+
+def instrumented(name=None):
+    """Dekorator: catat setiap pemanggilan fungsi ke profiler global."""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return profiler.call(label, func, args, kwargs)
+        return wrapper
+    return decorate
+
+
+class DataCache:
+    """Cache Feather (Arrow IPC) untuk hasil load_csv, disimpan per file sumber.
+
+    Entri berlaku selama path, ukuran, mtime dan hash isi (potongan awal dan akhir
+    file) sama dengan saat disimpan; bila CSV berubah entri otomatis dibuang. Begitu
+    juga bila CACHE_VERSION (format frame yang di-cache) berbeda.
+    """
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def _feather():
+        try:
+            import pyarrow
+            import pyarrow.feather
+            return pyarrow
+        except ImportError:
+            logging.info("pyarrow tidak terpasang, cache dinonaktifkan")
+            return None
+
+    @staticmethod
+    def fingerprint(filepath):
+        stat = os.stat(filepath)
+        digest = hashlib.blake2b(digest_size=16)
+        with open(filepath, 'rb') as f:
+            digest.update(f.read(CACHE_SAMPLE_BYTES))
+            if stat.st_size > CACHE_SAMPLE_BYTES:
+                f.seek(max(stat.st_size - CACHE_SAMPLE_BYTES, CACHE_SAMPLE_BYTES))
+                digest.update(f.read())
+        return {
+            'versi': CACHE_VERSION,
+            'path': os.path.abspath(filepath),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'hash': digest.hexdigest(),
+        }
+
+    def _entry(self, filepath):
+        name = hashlib.blake2b(os.path.abspath(filepath).encode('utf-8'), digest_size=12).hexdigest()
+        base = os.path.join(self.directory, name)
+        return base + '.feather', base + '.json'
+
+    def get(self, filepath, fingerprint=None):
+        pa = self._feather()
+        if pa is None:
+            return None
+        data_path, meta_path = self._entry(filepath)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta != (fingerprint or self.fingerprint(filepath)):
+            self._remove(data_path, meta_path)
+            return None
+        try:
+            table = pa.feather.read_table(data_path, memory_map=True)
+            df = table.to_pandas(split_blocks=True)
+        except Exception as e:
+            logging.warning(f"Cache rusak, dibaca ulang dari CSV: {e}")
+            self._remove(data_path, meta_path)
+            return None
+        # Tandai sebagai baru dipakai untuk urutan eviksi
+        os.utime(meta_path)
+        return df
+
+    def put(self, filepath, df, fingerprint=None):
+        pa = self._feather()
+        if pa is None:
+            return
+        data_path, meta_path = self._entry(filepath)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            table = pa.Table.from_pandas(df)
+            # Tanpa kompresi supaya bisa dibaca lewat memory-map
+            pa.feather.write_feather(table, data_path + '.tmp', compression='uncompressed')
+            os.replace(data_path + '.tmp', data_path)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(fingerprint or self.fingerprint(filepath), f)
+            self._evict()
+        except Exception as e:
+            logging.warning(f"Gagal menulis cache: {e}")
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            data_path = meta_path[:-len('.json')] + '.feather'
+            try:
+                size = os.path.getsize(data_path)
+                used = os.path.getmtime(meta_path)
+            except OSError:
+                continue
+            entries.append((used, size, data_path, meta_path))
+        total = sum(entry[1] for entry in entries)
+        for _, size, data_path, meta_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(data_path, meta_path)
+            total -= size
+
+    @staticmethod
+    def _remove(*paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+# Nomor versi data, unik lintas DataHandler
+_data_versions = itertools.count(1)
+
+
+class TaskCancelled(Exception):
+    """Dilempar di dalam tugas latar yang dibatalkan."""
+
+
+class TaskProgress:
+    """Callback progres untuk tugas latar; sekaligus titik pembatalan."""
     def __init__(self):
-        self.data = None
+        self.fraction = None
+        self.cancelled = threading.Event()
+
+    def __call__(self, fraction):
+        if self.cancelled.is_set():
+            raise TaskCancelled()
+        self.fraction = fraction
+
+
+class TaskRunner:
+    """Menjalankan pekerjaan berat di thread latar dan mengirim hasilnya ke thread Tk lewat root.after.
 
-    def load_csv(self, filepath):
+    Tugas baru pada kanal yang sama menggantikan tugas lama: tugas lama diminta
+    berhenti dan hasilnya dibuang walaupun sempat selesai.
+    """
+    POLL_MS = 50
+
+    def __init__(self, root, on_progress=None, on_idle=None):
+        self.root = root
+        self.on_progress = on_progress
+        self.on_idle = on_idle
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pad-task')
+        self._tasks = {}
+        self._ids = itertools.count(1)
+
+    def submit(self, channel, func, on_done, on_error=None):
+        self.cancel(channel, notify=False)
+        task_id = next(self._ids)
+        progress = TaskProgress()
+        self._tasks[channel] = (task_id, progress)
+        future = self.executor.submit(func, progress)
+        self.root.after(self.POLL_MS, self._poll, channel, task_id, future, on_done, on_error)
+
+    def cancel(self, channel=None, notify=True, keep=()):
+        """Batalkan satu kanal, atau semua kanal kecuali yang ada di keep."""
+        for name in ([channel] if channel else [name for name in self._tasks if name not in keep]):
+            task = self._tasks.pop(name, None)
+            if task is not None:
+                task[1].cancelled.set()
+        if notify and not self._tasks and self.on_idle:
+            self.on_idle()
+
+    def shutdown(self):
+        self.cancel(notify=False)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self, channel, task_id, future, on_done, on_error):
+        task = self._tasks.get(channel)
+        if task is None or task[0] != task_id:
+            # Dibatalkan atau digantikan tugas yang lebih baru
+            return
+        if not future.done():
+            if self.on_progress:
+                self.on_progress(task[1].fraction)
+            self.root.after(self.POLL_MS, self._poll, channel, task_id, future, on_done, on_error)
+            return
+
+        del self._tasks[channel]
+        if not self._tasks and self.on_idle:
+            self.on_idle()
         try:
-            df = pd.read_csv(filepath)
-            df.columns = [col.strip().lower().replace(' ', '_') for col in df.columns]
+            result = future.result()
+        except TaskCancelled:
+            return
+        except Exception as e:
+            logging.error(f"Tugas {channel} gagal: {e}")
+            if on_error:
+                on_error(e)
+            else:
+                messagebox.showerror("Error", str(e))
+            return
+        try:
+            on_done(result)
+        except Exception as e:
+            logging.error(f"Gagal menampilkan hasil {channel}: {e}")
+            messagebox.showerror("Error", str(e))
 
-            required_columns = ['tanggal', 'produk', 'jumlah_terjual', 'harga_satuan']
-            missing = [col for col in required_columns if col not in df.columns]
-            if missing:
-                raise ValueError(f"Kolom berikut tidak ditemukan: {', '.join(missing)}")
 
-            df['tanggal'] = pd.to_datetime(df['tanggal'], errors='coerce')
-            df['jumlah_terjual'] = pd.to_numeric(df['jumlah_terjual'], errors='coerce')
-            df['harga_satuan'] = pd.to_numeric(df['harga_satuan'], errors='coerce')
+def sorted_positions(dates, product_rows, start, end, product=None):
+    """Posisi baris untuk start <= tanggal <= end (dan produk) pada data yang terurut menurut tanggal.
+
+    Batas yang None berarti tidak dibatasi. Mengembalikan slice bila tanpa filter
+    produk, selain itu array posisi.
+    """
+    lo = 0 if start is None else dates.searchsorted(pd.Timestamp(start).to_datetime64(), side='left')
+    hi = len(dates) if end is None else dates.searchsorted(pd.Timestamp(end).to_datetime64(), side='right')
+    if product is None:
+        return slice(lo, hi)
+    rows = product_rows.get(product, np.empty(0, dtype=np.intp))
+    return rows[rows.searchsorted(lo):rows.searchsorted(hi)]
+
+
+def product_positions(dates, product_rows, products, start=None, end=None):
+    """Posisi baris (terurut) milik beberapa produk, opsional dibatasi rentang tanggal."""
+    parts = [sorted_positions(dates, product_rows, start, end, product) for product in products]
+    if not parts:
+        return np.empty(0, dtype=np.intp)
+    return np.sort(np.concatenate(parts), kind='stable')
+
+
+class ProductIndex:
+    """Indeks pencarian substring atas nama produk (huruf kecil).
+
+    Kosakata produk jauh lebih kecil dari jumlah baris, jadi kata kunci dicocokkan
+    ke nama produk lewat indeks trigram, lalu baris diambil dari posisi per produk.
+    """
+    N = 3
+
+    def __init__(self, products=()):
+        self.names = {}
+        self.grams = {}
+        self._matches = {}
+        for product in products:
+            self.add(product)
+
+    @classmethod
+    def ngrams(cls, text):
+        return {text[i:i + cls.N] for i in range(len(text) - cls.N + 1)}
+
+    def add(self, product):
+        name = str(product).lower()
+        if product in self.names.get(name, ()):
+            return
+        self.names.setdefault(name, []).append(product)
+        for gram in self.ngrams(name):
+            self.grams.setdefault(gram, set()).add(name)
+        self._matches.clear()
+
+    def match(self, keyword):
+        """Produk yang namanya memuat keyword (pencocokan literal, tanpa regex)."""
+        keyword = keyword.lower()
+        if keyword not in self._matches:
+            if len(keyword) < self.N:
+                candidates = self.names
+            else:
+                sets = sorted((self.grams.get(gram, set()) for gram in self.ngrams(keyword)), key=len)
+                candidates = set.intersection(*sets)
+            self._matches[keyword] = [product for name in sorted(candidates) if keyword in name
+                                      for product in self.names[name]]
+        return self._matches[keyword]
+
+
+class SalesCube:
+    """Agregat per tanggal x produk (unit terjual dan pendapatan), dibangun sekali saat load.
+
+    Semua agregat SalesAnalyzer berupa jumlah, sehingga bisa dihitung dari kubus ini
+    dengan biaya O(hari x produk), bukan O(transaksi).
+    """
+    KEYS = ['tanggal', 'produk']
+    VALUES = ['jumlah_terjual', 'pendapatan']
+
+    def __init__(self, frame):
+        self.frame = frame
+        self._dates = self.frame['tanggal'].to_numpy()
+        self._product_rows = self.frame.groupby('produk', sort=False, observed=True).indices
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data.groupby(cls.KEYS, sort=True, dropna=False, observed=True)[cls.VALUES].sum().reset_index())
+
+    @classmethod
+    def merge(cls, frames):
+        """Gabungkan kubus parsial (misalnya dari beberapa file) menjadi satu."""
+        return cls.from_data(concat_frames(frames, ignore_index=True))
+
+    def appended(self, data):
+        """Kubus baru dengan tambahan baris data yang tanggalnya tidak lebih awal dari kubus ini.
+
+        Hanya baris kubus pada tanggal yang tumpang tindih (paling banyak tanggal
+        terakhir) yang dijumlahkan ulang bersama baris baru; posisi per produk
+        dipotong dan disambung, bukan dikelompokkan ulang dari awal.
+        """
+        split = int(np.searchsorted(self._dates, data['tanggal'].to_numpy().min(), side='left'))
+        tail = concat_frames([self.frame.iloc[split:], data[self.KEYS + self.VALUES]], ignore_index=True)
+        tail = tail.groupby(self.KEYS, sort=True, dropna=False, observed=True)[self.VALUES].sum().reset_index()
+        cube = SalesCube.__new__(SalesCube)
+        cube.frame = concat_frames([self.frame.iloc[:split], tail], ignore_index=True)
+        cube._dates = np.concatenate([self._dates[:split], tail['tanggal'].to_numpy()])
+        cube._product_rows = {product: rows[:np.searchsorted(rows, split)]
+                              for product, rows in self._product_rows.items()}
+        for product, rows in tail.groupby('produk', sort=False, observed=True).indices.items():
+            old = cube._product_rows.get(product, np.empty(0, dtype=np.intp))
+            cube._product_rows[product] = np.concatenate([old, rows + split])
+        return cube
+
+
+class QuantileSketch:
+    """Sketsa kuantil bergalat relatif tetap (gaya DDSketch) untuk nilai pendapatan.
+
+    Nilai dikelompokkan ke ember logaritmik berbasis gamma, sehingga kuantil yang
+    dikembalikan berjarak paling jauh relative_accuracy dari nilai sebenarnya.
+    Sketsa dari potongan atau file berbeda dapat digabung tanpa menambah galat.
+    """
+    def __init__(self, relative_accuracy=SKETCH_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, values):
+        values = np.asarray(values, dtype='float64')
+        values = values[~np.isnan(values)]
+        self.count += len(values)
+        self.zeros += int(np.count_nonzero(values == 0))
+        self._add_buckets(self.positive, values[values > 0])
+        self._add_buckets(self.negative, -values[values < 0])
+
+    def _add_buckets(self, store, values):
+        if not len(values):
+            return
+        keys = np.ceil(np.log(values) / self._log_gamma).astype(np.int64)
+        keys, counts = np.unique(keys, return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Sketsa dengan akurasi berbeda tidak dapat digabung")
+        merged = QuantileSketch(self.relative_accuracy)
+        for name in ('positive', 'negative'):
+            store = dict(getattr(self, name))
+            for key, count in getattr(other, name).items():
+                store[key] = store.get(key, 0) + count
+            setattr(merged, name, store)
+        merged.zeros = self.zeros + other.zeros
+        merged.count = self.count + other.count
+        return merged
+
+    def to_dict(self):
+        """Isi sketsa sebagai tipe JSON biasa."""
+        return {'akurasi': self.relative_accuracy, 'nol': self.zeros, 'jumlah': self.count,
+                'positif': {str(key): count for key, count in self.positive.items()},
+                'negatif': {str(key): count for key, count in self.negative.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(float(data['akurasi']))
+        sketch.zeros = int(data['nol'])
+        sketch.count = int(data['jumlah'])
+        sketch.positive = {int(key): int(count) for key, count in data['positif'].items()}
+        sketch.negative = {int(key): int(count) for key, count in data['negatif'].items()}
+        return sketch
+
+    def _value(self, key):
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q):
+        if not self.count:
+            return float('nan')
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive))
+
+
+class SummaryStats:
+    """Statistik ringkasan pendapatan yang dihitung sekali jalan dan dapat digabung.
+
+    Menyimpan jumlah transaksi, rata-rata dan M2 (jumlah kuadrat simpangan, digabung
+    dengan rumus Chan/Welford), minimum/maksimum, rentang tanggal, total unit dan
+    pendapatan per produk, serta (opsional) sketsa kuantil. Dipakai untuk label
+    ringkasan, export_summary, pemuatan per potongan, paralel dan mode pantau.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.start = None
+        self.end = None
+        self.units = pd.Series(dtype='int64')
+        self.income = pd.Series(dtype='float64')
+        self.sketch = None
+
+    @classmethod
+    def from_frame(cls, df, quantiles=True, cube=None):
+        """Statistik satu frame; total per produk diambil dari cube bila diberikan (lebih sedikit baris)."""
+        stats = cls()
+        if quantiles:
+            stats.sketch = QuantileSketch()
+        if df is None or df.empty:
+            return stats
+        income = df['pendapatan'] if 'pendapatan' in df else revenue(df['jumlah_terjual'], df['harga_satuan'])
+        values = income.to_numpy(dtype='float64')
+        stats.count = len(values)
+        stats.mean = float(values.mean())
+        stats.m2 = float(np.square(values - stats.mean).sum())
+        stats.minimum = float(values.min())
+        stats.maximum = float(values.max())
+        stats.start = df['tanggal'].min()
+        stats.end = df['tanggal'].max()
+        source = cube if cube is not None else pd.DataFrame(
+            {'produk': df['produk'], 'jumlah_terjual': df['jumlah_terjual'], 'pendapatan': income})
+        totals = source.groupby('produk', observed=True)[['jumlah_terjual', 'pendapatan']].sum()
+        totals.index = totals.index.astype(object)
+        stats.units = totals['jumlah_terjual']
+        stats.income = totals['pendapatan']
+        if quantiles:
+            stats.sketch.add(values)
+        return stats
+
+    @classmethod
+    def grouped(cls, df, by, cube):
+        """Statistik setiap kelompok kolom by (misalnya produk atau bulan) dari satu groupby.
+
+        Hasilnya sama dengan from_frame per kelompok tanpa memfilter data sekali per
+        kelompok; total per produk diambil dari cube yang juga memiliki kolom by.
+        Sketsa kuantil tidak dihitung.
+        """
+        keys = df[by]
+        income = df['pendapatan'].astype('float64')
+        groups = income.groupby(keys, observed=True)
+        agg = groups.agg(['count', 'mean', 'min', 'max'])
+        m2 = np.square(income - groups.transform('mean')).groupby(keys, observed=True).sum()
+        dates = df['tanggal'].groupby(keys, observed=True).agg(['min', 'max'])
+        totals = cube.groupby([by, 'produk'], observed=True)[['jumlah_terjual', 'pendapatan']].sum()
+        result = {}
+        for key, part in totals.groupby(level=0, observed=True):
+            if key not in agg.index:
+                continue
+            stats = cls()
+            row = agg.loc[key]
+            stats.count = int(row['count'])
+            stats.mean = float(row['mean'])
+            stats.m2 = float(m2[key])
+            stats.minimum = float(row['min'])
+            stats.maximum = float(row['max'])
+            stats.start = dates.at[key, 'min']
+            stats.end = dates.at[key, 'max']
+            part = part.droplevel(0)
+            part.index = part.index.astype(object)
+            stats.units = part['jumlah_terjual']
+            stats.income = part['pendapatan']
+            result[key] = stats
+        return result
+
+    @staticmethod
+    def _add_totals(left, right):
+        return pd.concat([left, right]).groupby(level=0).sum()
+
+    def merge(self, other):
+        """Gabungan dua statistik parsial, seolah dihitung dari gabungan datanya."""
+        merged = SummaryStats()
+        if self.sketch is not None and other.sketch is not None:
+            merged.sketch = self.sketch.merge(other.sketch)
+        if not other.count or not self.count:
+            # Sisi kosong (misalnya SummaryStats() awal pada combine) tidak menghapus sketsa sisi lain
+            source = self if self.count else other
+            if merged.sketch is None:
+                merged.sketch = source.sketch
+            for name in ('count', 'mean', 'm2', 'minimum', 'maximum', 'start', 'end', 'units', 'income'):
+                setattr(merged, name, getattr(source, name))
+            return merged
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        merged.count = count
+        merged.mean = self.mean + delta * other.count / count
+        merged.m2 = self.m2 + other.m2 + delta ** 2 * self.count * other.count / count
+        merged.minimum = min(self.minimum, other.minimum)
+        merged.maximum = max(self.maximum, other.maximum)
+        merged.start = min(self.start, other.start)
+        merged.end = max(self.end, other.end)
+        merged.units = self._add_totals(self.units, other.units)
+        merged.income = self._add_totals(self.income, other.income)
+        return merged
+
+    @classmethod
+    def combine(cls, parts):
+        return functools.reduce(cls.merge, parts, cls())
+
+    def to_dict(self):
+        """Statistik sebagai tipe JSON biasa (misalnya untuk tabel meta SalesStore)."""
+        def number(value):
+            return value.item() if isinstance(value, np.generic) else value
+
+        return {
+            'count': int(self.count), 'mean': float(self.mean), 'm2': float(self.m2),
+            'minimum': number(self.minimum), 'maximum': number(self.maximum),
+            'start': None if self.start is None else pd.Timestamp(self.start).isoformat(),
+            'end': None if self.end is None else pd.Timestamp(self.end).isoformat(),
+            'units': {str(key): number(value) for key, value in self.units.items()},
+            'income': {str(key): number(value) for key, value in self.income.items()},
+            'sketch': None if self.sketch is None else self.sketch.to_dict(),
+        }
+
+    @staticmethod
+    def _totals(values):
+        dtype = 'float64' if any(isinstance(value, float) for value in values.values()) else 'int64'
+        totals = pd.Series(values, dtype=dtype)
+        totals.index = totals.index.astype(object)
+        return totals
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.count = int(data['count'])
+        stats.mean = float(data['mean'])
+        stats.m2 = float(data['m2'])
+        stats.minimum = None if data['minimum'] is None else float(data['minimum'])
+        stats.maximum = None if data['maximum'] is None else float(data['maximum'])
+        stats.start = None if data['start'] is None else pd.Timestamp(data['start'])
+        stats.end = None if data['end'] is None else pd.Timestamp(data['end'])
+        stats.units = cls._totals(data['units'])
+        stats.income = cls._totals(data['income'])
+        stats.sketch = None if data['sketch'] is None else QuantileSketch.from_dict(data['sketch'])
+        return stats
+
+    @property
+    def total_units(self):
+        return int(self.units.sum())
+
+    @property
+    def total_income(self):
+        return self.income.sum()
+
+    @property
+    def std(self):
+        # Simpangan baku populasi, sama dengan np.std
+        return float(np.sqrt(self.m2 / self.count)) if self.count else float('nan')
+
+    def top_product(self):
+        if self.units.empty:
+            return None, 0
+        product = self.units.idxmax()
+        return product, self.units[product]
+
+    def quantile(self, q):
+        if self.sketch is None or not self.count:
+            return float('nan')
+        # Perkiraan ember bisa sedikit melewati nilai ekstrem yang diketahui pasti
+        return min(max(self.sketch.quantile(q), self.minimum), self.maximum)
+
+
+def downcast_numeric(values):
+    """Tipe terkecil yang tetap memuat semua nilai: integer bila semuanya bulat, lalu float32 bila tanpa kehilangan presisi."""
+    if values.empty:
+        return values
+    as_int = pd.to_numeric(values, downcast='integer')
+    if pd.api.types.is_integer_dtype(as_int):
+        return as_int
+    as_float = values.astype('float32')
+    if np.array_equal(as_float.to_numpy(dtype='float64'), values.to_numpy(dtype='float64')):
+        return as_float
+    return values
+
+
+def revenue(quantity, price):
+    """jumlah x harga dalam int64 bila hasilnya pasti muat, selain itu float64."""
+    if (pd.api.types.is_integer_dtype(quantity) and pd.api.types.is_integer_dtype(price)
+            and (quantity.empty or int(quantity.abs().max()) * int(price.abs().max()) < 2 ** 63)):
+        return quantity.astype('int64') * price.astype('int64')
+    return quantity.astype('float64') * price.astype('float64')
+
+
+def derive_columns(df):
+    """Kolom turunan dan skema hemat memori untuk data yang sudah dibersihkan.
+
+    produk menjadi kategori, bulan disimpan sebagai periode (bukan teks), angka
+    diperkecil tipenya dan pendapatan dihitung tanpa risiko overflow.
+    """
+    df['produk'] = df['produk'].astype('category')
+    df['jumlah_terjual'] = downcast_numeric(df['jumlah_terjual'])
+    df['harga_satuan'] = downcast_numeric(df['harga_satuan'])
+    df['bulan'] = df['tanggal'].dt.to_period('M')
+    df['pendapatan'] = revenue(df['jumlah_terjual'], df['harga_satuan'])
+    return df
+
+
+def concat_frames(frames, ignore_index=False):
+    """pd.concat yang mempertahankan produk sebagai kategori walau kategori tiap bagian berbeda."""
+    categories = [frame['produk'].cat.categories for frame in frames
+                  if isinstance(frame['produk'].dtype, pd.CategoricalDtype)]
+    if len(categories) == len(frames) and frames:
+        merged = categories[0]
+        for other in categories[1:]:
+            if not other.isin(merged).all():
+                merged = merged.union(other)
+        frames = [frame if frame['produk'].cat.categories.equals(merged)
+                  else frame.assign(produk=frame['produk'].cat.set_categories(merged))
+                  for frame in frames]
+    return pd.concat(frames, ignore_index=ignore_index)
+
+
+def row_hashes(df):
+    """Hash per baris untuk deteksi duplikat lintas potongan.
+
+    Kolom numerik disamakan ke float64 dulu, karena potongan yang berisi nilai rusak
+    terbaca sebagai float sedangkan potongan lain sebagai int.
+    """
+    numeric = df.select_dtypes('number').columns
+    if len(numeric):
+        df = df.astype({col: 'float64' for col in numeric})
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def file_tail_offset(filepath, size):
+    """Posisi byte tepat setelah baris lengkap terakhir di dalam size byte pertama file."""
+    with open(filepath, 'rb') as f:
+        pos = size
+        while pos > 0:
+            step = min(64 * 1024, pos)
+            f.seek(pos - step)
+            newline = f.read(step).rfind(b'\n')
+            if newline >= 0:
+                return pos - step + newline + 1
+            pos -= step
+    return 0
+
+
+class FilePrefix(io.RawIOBase):
+    """File biner yang hanya memperlihatkan size byte pertama, misalnya sampai baris lengkap terakhir."""
+
+    def __init__(self, filepath, size):
+        self._file = open(filepath, 'rb')
+        self._size = size
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        left = self._size - self._file.tell()
+        if left <= 0:
+            return 0
+        return self._file.readinto(memoryview(buffer)[:left])
+
+    def tell(self):
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def open_prefix(filepath, size):
+    return io.BufferedReader(FilePrefix(filepath, size))
+
+
+# Baris baru hasil mode tail: data bersih, hash barisnya dan offset byte berikutnya
+TailUpdate = namedtuple('TailUpdate', ['rows', 'hashes', 'offset'])
+
+# Data DataHandler beserta indeks, kubus dan statistiknya. Selalu diganti sebagai satu
+# objek, sehingga thread latar yang memegang satu DataState tidak melihat campuran
+# data lama dan baru.
+DataState = namedtuple('DataState', ['data', 'dates', 'product_rows', 'search_index', 'cube', 'stats', 'version'])
+
+
+def csv_paths(source):
+    """Daftar file CSV dari folder, pola glob, atau daftar path; kosong bila tidak ada yang cocok."""
+    if isinstance(source, (list, tuple)):
+        return [path for item in source for path in csv_paths(item)]
+    if os.path.isdir(source):
+        return sorted(glob.glob(os.path.join(source, '*.csv')))
+    return sorted(glob.glob(source)) or ([source] if os.path.exists(source) else [])
+
+
+def load_partial(path, cache_dir=None):
+    """Dijalankan di proses pekerja: data bersih satu CSV beserta kubus parsialnya."""
+    handler = DataHandler(cache=DataCache(cache_dir) if cache_dir else None)
+    if not handler.load_csv(path):
+        raise ValueError(handler.last_error)
+    return handler.data, handler.cube.frame, handler.stats
 
-            df.dropna(subset=['tanggal', 'jumlah_terjual', 'harga_satuan'], inplace=True)
-            df.drop_duplicates(inplace=True)
-            df['bulan'] = df['tanggal'].dt.to_period('M').astype(str)
-            df['pendapatan'] = df['jumlah_terjual'] * df['harga_satuan']
 
-            self.data = df
+class DataHandler:
+    """Kelas untuk mengelola pemuatan dan praproses data penjualan."""
+    def __init__(self, cache=None):
+        self.state = DataState(None, None, {}, ProductIndex(), None, None, 0)
+        self.cache = cache
+        self.last_error = None
+        self.skipped_files = []
+        self.source = None
+
+    @property
+    def data(self):
+        return self.state.data
+
+    @property
+    def cube(self):
+        return self.state.cube
+
+    @property
+    def stats(self):
+        return self.state.stats
+
+    @property
+    def version(self):
+        return self.state.version
+
+    @property
+    def search_index(self):
+        return self.state.search_index
+
+    @property
+    def _dates(self):
+        return self.state.dates
+
+    @property
+    def _product_rows(self):
+        return self.state.product_rows
+
+    @instrumented()
+    def load_csv(self, filepath, chunksize=None, progress=None, follow=False):
+        """Memuat CSV sekaligus, atau per potongan bila chunksize diisi.
+
+        progress (opsional) dipanggil dengan pecahan 0..1 setiap satu potongan selesai.
+        Bila cache dipasang dan CSV tidak berubah, hasil bersih diambil dari cache.
+        Dengan follow (mode "Pantau File") baris terakhir yang belum diakhiri baris
+        baru ditahan karena mungkin masih ditulis; mode tail membacanya setelah
+        lengkap. Tanpa follow seluruh file dibaca, termasuk baris terakhir itu.
+        """
+        try:
+            size = os.path.getsize(filepath)
+            # Posisi akhir baris lengkap saat ini, titik awal mode tail. Tanpa baris
+            # lengkap sama sekali (hanya header tanpa baris baru) seluruh file dianggap terbaca.
+            tail_offset = file_tail_offset(filepath, size) or size
+            limit = tail_offset if follow else size
+            fingerprint = None
+            # Cache hanya menyimpan hasil pembacaan seluruh file
+            use_cache = self.cache is not None and limit == size
+            if use_cache:
+                fingerprint = self.cache.fingerprint(filepath)
+                df = self.cache.get(filepath, fingerprint)
+                if df is not None:
+                    self.set_data(df)
+                    self._start_tail(filepath, tail_offset)
+                    return True
+
+            stats = None
+            if limit < size:
+                logging.info(f"{filepath}: baris terakhir belum diakhiri baris baru, ditahan untuk mode tail")
+            if chunksize:
+                df, stats = self._read_chunked(filepath, chunksize, progress, limit)
+            else:
+                # Semua kolom dibaca sebagai teks, tipe data ditetapkan saat pembersihan
+                with open_prefix(filepath, limit) as f:
+                    df = pd.read_csv(f, dtype=str)
+                df.columns = [normalize_column(col) for col in df.columns]
+                self._check_columns(df.columns)
+                df = self._clean(df)
+                df.drop_duplicates(inplace=True)
+
+            df = derive_columns(df)
+
+            self.set_data(df, stats=stats)
+            self._start_tail(filepath, tail_offset)
+            if use_cache:
+                self.cache.put(filepath, self.data, fingerprint)
             return True
+        except TaskCancelled:
+            raise
         except Exception as e:
+            # Bisa berjalan di thread latar, jadi pesan error ditampilkan oleh pemanggil
             logging.error(f"Gagal memuat file: {e}")
-            messagebox.showerror("Error", f"Gagal memuat file: {e}")
+            self.last_error = str(e)
+            return False
+
+    def _start_tail(self, filepath, offset):
+        self.source = filepath
+        self._tail_offset = offset
+        self._row_hashes = None
+        with open(filepath, 'rb') as f:
+            self._tail_header = f.readline()
+        # Format tanggal ditebak dari teks asli, sama seperti saat pemuatan awal
+        sample = pd.read_csv(filepath, dtype=str, nrows=1000)
+        sample.columns = [normalize_column(col) for col in sample.columns]
+        first = sample['tanggal'].dropna()
+        self._date_format = None if first.empty else guess_datetime_format(first.iloc[0])
+
+    @instrumented()
+    def read_new_rows(self):
+        """Baca hanya baris yang ditambahkan ke file sumber sejak pemuatan terakhir.
+
+        Baris dibersihkan seperti load_csv dan dicocokkan dengan hash baris yang sudah
+        ada. Tidak mengubah data, sehingga aman dijalankan di thread latar; hasilnya
+        diterapkan dengan append_rows.
+        """
+        if self.source is None:
+            raise ValueError("Mode tail hanya untuk data dari satu file CSV")
+        size = os.path.getsize(self.source)
+        if size < self._tail_offset:
+            raise ValueError("File sumber menyusut, muat ulang file")
+        with open(self.source, 'rb') as f:
+            f.seek(self._tail_offset)
+            chunk = f.read(size - self._tail_offset)
+        end = chunk.rfind(b'\n') + 1
+        if end == 0:
+            return TailUpdate(None, None, self._tail_offset)
+
+        df = pd.read_csv(io.BytesIO(self._tail_header + chunk[:end]), dtype=str)
+        df.columns = [normalize_column(col) for col in df.columns]
+        self._check_columns(df.columns)
+        columns = [col for col in self.data.columns if col not in ('bulan', 'pendapatan')]
+        df = self._clean(df.reindex(columns=columns), self._date_format)
+        df['tanggal'] = df['tanggal'].astype(self.data['tanggal'].dtype)
+
+        if self._row_hashes is None:
+            self._row_hashes = set(row_hashes(self.data[columns]).tolist())
+        hashes = row_hashes(df)
+        keep = ~pd.Series(hashes).duplicated().to_numpy()
+        keep &= np.fromiter((h not in self._row_hashes for h in hashes.tolist()), dtype=bool, count=len(hashes))
+        df = df[keep]
+        df = derive_columns(df)
+        return TailUpdate(df, hashes[keep], self._tail_offset + end)
+
+    @instrumented()
+    def append_rows(self, update):
+        """Terapkan hasil read_new_rows dan kembalikan jumlah baris yang ditambahkan.
+
+        Untuk baris yang datang berurutan, kubus, posisi per produk dan statistik
+        diperbarui sebanding dengan baris baru (ditambah satu hari terakhir kubus).
+        Frame data dan larik tanggal tetap disalin utuh oleh concat, jadi masih ada
+        satu salinan memori O(jumlah baris) per tambahan. Baris yang lebih awal dari
+        data yang ada membuat semuanya disusun ulang. Keadaan baru dipasang sekaligus
+        sebagai satu DataState.
+        """
+        self._tail_offset = update.offset
+        new = update.rows
+        if new is None or new.empty:
+            return 0
+        self._row_hashes.update(update.hashes.tolist())
+        new = new.sort_values('tanggal', kind='stable')
+        stats = self.stats.merge(SummaryStats.from_frame(new))
+        if len(self.data) and new['tanggal'].iloc[0] < self._dates[-1]:
+            # Baris datang tidak berurutan: susun ulang semuanya
+            self.set_data(concat_frames([self.data, new]), stats=stats)
+            return len(new)
+
+        start = len(self.data)
+        product_rows = dict(self._product_rows)
+        for product, rows in new.groupby('produk', sort=False, observed=True).indices.items():
+            old = product_rows.get(product, np.empty(0, dtype=np.intp))
+            product_rows[product] = np.concatenate([old, rows + start])
+        search_index = self.search_index
+        if len(product_rows) > len(self._product_rows):
+            # Indeks lama masih bisa dipakai pembaca lain, jadi produk baru masuk ke indeks baru
+            search_index = ProductIndex(product_rows)
+        self.state = DataState(concat_frames([self.data, new]),
+                               np.concatenate([self._dates, new['tanggal'].to_numpy()]),
+                               product_rows, search_index, self.cube.appended(new), stats,
+                               next(_data_versions))
+        return len(new)
+
+    @staticmethod
+    def _check_columns(columns):
+        missing = [col for col in REQUIRED_COLUMNS if col not in columns]
+        if missing:
+            raise ValueError(f"Kolom berikut tidak ditemukan: {', '.join(missing)}")
+
+    @staticmethod
+    def _clean(df, date_format=None):
+        if date_format:
+            df['tanggal'] = pd.to_datetime(df['tanggal'], errors='coerce', format=date_format)
+        else:
+            df['tanggal'] = pd.to_datetime(df['tanggal'], errors='coerce')
+        df['jumlah_terjual'] = pd.to_numeric(df['jumlah_terjual'], errors='coerce')
+        df['harga_satuan'] = pd.to_numeric(df['harga_satuan'], errors='coerce')
+        df.dropna(subset=['tanggal', 'jumlah_terjual', 'harga_satuan'], inplace=True)
+        return df
+
+    @classmethod
+    def clean_chunks(cls, filepath, chunksize, progress=None, size=None):
+        """Potongan CSV yang sudah dibersihkan (belum dibuang duplikatnya).
+
+        Format tanggal ditebak sekali dari potongan pertama dan dipakai untuk semua
+        potongan. progress dipanggil dengan posisi baca file setelah potongan diproses.
+        size membatasi pembacaan ke size byte pertama file.
+        """
+        if size is None:
+            size = os.path.getsize(filepath)
+        total = size or 1
+        date_format = None
+        checked = False
+        with open_prefix(filepath, size) as f:
+            reader = pd.read_csv(f, dtype=str, chunksize=chunksize)
+            for chunk in reader:
+                chunk.columns = [normalize_column(col) for col in chunk.columns]
+                if not checked:
+                    cls._check_columns(chunk.columns)
+                    checked = True
+                if date_format is None:
+                    # Samakan dengan mode sekaligus: format ditebak dari tanggal pertama yang terisi
+                    first = chunk['tanggal'].dropna()
+                    if not first.empty:
+                        date_format = guess_datetime_format(first.iloc[0]) or ''
+                yield cls._clean(chunk, date_format)
+
+                if progress is not None:
+                    progress(min(f.tell() / total, 1.0))
+
+    def _read_chunked(self, filepath, chunksize, progress=None, size=None):
+        """Membaca CSV per potongan; duplikat dibuang juga lintas batas potongan.
+
+        Hanya hash baris yang sudah terlihat yang disimpan, sehingga memori tambahan
+        sebanding dengan jumlah baris unik, bukan ukuran file mentah. Statistik
+        ringkasan dihitung per potongan lalu digabung.
+        """
+        seen = set()
+        parts = []
+        stats = SummaryStats()
+        for chunk in self.clean_chunks(filepath, chunksize, progress, size):
+            hashes = row_hashes(chunk)
+            keep = ~pd.Series(hashes).duplicated().to_numpy()
+            if seen:
+                keep &= np.fromiter((h not in seen for h in hashes.tolist()), dtype=bool, count=len(hashes))
+            seen.update(hashes[keep].tolist())
+            parts.append(chunk[keep])
+            stats = stats.merge(SummaryStats.from_frame(parts[-1]))
+        if not parts:
+            raise ValueError("File kosong")
+        return pd.concat(parts), stats
+
+    def set_data(self, df, cube=None, stats=None):
+        """Simpan data terurut menurut tanggal beserta indeks tanggal dan posisi baris per produk.
+
+        cube dan stats boleh diisi bila sudah dihitung (misalnya digabung dari pekerja
+        atau per potongan).
+        """
+        if not df['tanggal'].is_monotonic_increasing:
+            df = df.sort_values('tanggal', kind='stable')
+        product_rows = df.groupby('produk', sort=False, observed=True).indices
+        cube = cube if cube is not None else SalesCube.from_data(df)
+        stats = stats if stats is not None else SummaryStats.from_frame(df, cube=cube.frame)
+        self.state = DataState(df, df['tanggal'].to_numpy(), product_rows, ProductIndex(product_rows),
+                               cube, stats, next(_data_versions))
+
+    @instrumented()
+    def load_many(self, source, workers=None, progress=None):
+        """Memuat banyak CSV (folder, pola glob atau daftar path) secara paralel.
+
+        Setiap proses pekerja membersihkan satu file dan menghitung kubus parsialnya;
+        kubus digabung di sini sehingga tidak perlu dihitung ulang dari semua baris.
+        Duplikat hanya dibuang di dalam file yang sama. File yang gagal dilewati
+        dan dicatat di skipped_files.
+        """
+        try:
+            paths = csv_paths(source)
+            if not paths:
+                raise ValueError("Tidak ada file CSV yang ditemukan")
+            cache_dir = self.cache.directory if self.cache is not None else None
+            results, self.skipped_files = {}, []
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(load_partial, path, cache_dir): path for path in paths}
+                try:
+                    for done, future in enumerate(as_completed(futures), 1):
+                        path = futures[future]
+                        try:
+                            results[path] = future.result()
+                        except Exception as e:
+                            logging.error(f"Lewati {path}: {e}")
+                            self.skipped_files.append(path)
+                        if progress is not None:
+                            progress(done / len(paths))
+                except TaskCancelled:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+            if not results:
+                raise ValueError("Semua file gagal dimuat")
+            # Urutan file tetap, tidak bergantung pada pekerja mana yang selesai lebih dulu
+            frames, cubes, stats = zip(*(results[path] for path in paths if path in results))
+            self.set_data(concat_frames(list(frames), ignore_index=True), SalesCube.merge(list(cubes)),
+                          SummaryStats.combine(stats))
+            self.source = None
+            return True
+        except TaskCancelled:
+            raise
+        except Exception as e:
+            logging.error(f"Gagal memuat file: {e}")
+            self.last_error = str(e)
             return False
 
     def get_data(self):
         return self.data
 
-    def filter_by_date(self, start, end):
-        if self.data is not None:
-            return self.data[(self.data['tanggal'] >= start) & (self.data['tanggal'] <= end)]
-        return pd.DataFrame()
+    def products(self):
+        return sorted(self._product_rows)
+
+    def filter_by_date(self, start, end, product=None):
+        return self.query().where(start, end, product).collect()
+
+    def search(self, keyword, start=None, end=None, product=None):
+        """Baris yang nama produknya memuat keyword, opsional dalam rentang tanggal dan produk."""
+        return self.query().where(start, end, product, keyword).collect()
+
+    def query(self):
+        """Awal rencana kueri malas atas data ini (lihat Query)."""
+        return Query(self, self.state)
 
 class SalesAnalyzer:
     """Kelas untuk melakukan analisis statistik dan ekspor data penjualan."""
-    def __init__(self, data):
-        self.data = data.copy()
-
+    def __init__(self, data, cube=None, stats=None):
+        # Hanya dibaca, tidak perlu disalin
+        self.data = data
+        self.stats = stats
+        # Agregat dijawab dari kubus (tanggal x produk) bila tersedia, selain itu dari data mentah
+        self.agg = cube if cube is not None else self.data
+
+    @instrumented()
     def total_sales_per_product(self):
-        return self.data.groupby('produk')['jumlah_terjual'].sum()
+        return self.agg.groupby('produk', observed=True)['jumlah_terjual'].sum()
 
+    @instrumented()
     def daily_income(self):
-        return self.data.groupby('tanggal')['pendapatan'].sum()
+        return self.agg.groupby('tanggal')['pendapatan'].sum()
+
+    def _monthly(self, column):
+        daily = self.agg.groupby('tanggal')[column].sum()
+        return daily.groupby(daily.index.to_period('M')).sum()
 
+    @instrumented()
     def monthly_sales(self):
-        return self.data.groupby(self.data['tanggal'].dt.to_period('M'))['jumlah_terjual'].sum()
+        return self._monthly('jumlah_terjual')
 
+    @instrumented()
     def monthly_income(self):
-        return self.data.groupby(self.data['tanggal'].dt.to_period('M'))['pendapatan'].sum()
+        return self._monthly('pendapatan')
 
+    @instrumented()
     def income_per_product(self):
-        return self.data.groupby('produk')['pendapatan'].sum()
-
-    def export_summary(self, file_path):
-        total_sales = self.total_sales_per_product().sum()
-        total_income = self.data['pendapatan'].sum()
-        mean_income = np.mean(self.data['pendapatan'])
-        std_income = np.std(self.data['pendapatan'])
-        count_data = len(self.data)
-        start_date = self.data['tanggal'].min().strftime('%Y-%m-%d')
-        end_date = self.data['tanggal'].max().strftime('%Y-%m-%d')
-        sales_series = self.total_sales_per_product()
-        top_product = sales_series.idxmax()
-        top_sales = sales_series.max()
+        return self.agg.groupby('produk', observed=True)['pendapatan'].sum()
+
+    @instrumented()
+    def summary_stats(self, quantiles=False):
+        """SummaryStats milik data ini; dihitung sekali jalan bila belum diberikan saat konstruksi."""
+        if self.stats is None or (quantiles and self.stats.sketch is None):
+            cube = self.agg if self.agg is not self.data else None
+            self.stats = SummaryStats.from_frame(self.data, quantiles=quantiles, cube=cube)
+        return self.stats
+
+    @instrumented()
+    def export_summary(self, file_path, extended=False):
+        """Tulis ringkasan statistik ke CSV; extended menambahkan minimum, maksimum, median dan persentil."""
+        self.summary_frame(self.summary_stats(quantiles=extended), extended).to_csv(file_path, index=False)
+
+    @staticmethod
+    def summary_frame(stats, extended=False):
+        """Tabel Keterangan/Nilai dari SummaryStats, seperti yang ditulis export_summary."""
+        total_sales = stats.total_units
+        total_income = stats.total_income
+        mean_income = stats.mean
+        std_income = stats.std
+        count_data = stats.count
+        start_date = stats.start.strftime('%Y-%m-%d')
+        end_date = stats.end.strftime('%Y-%m-%d')
+        top_product, top_sales = stats.top_product()
 
         summary = pd.DataFrame({
             'Keterangan': [
@@ -109,40 +1318,955 @@ class SalesAnalyzer:
                 top_sales
             ]
         })
-        summary.to_csv(file_path, index=False)
-
-    def draw_plot(self, series, kind, title, parent):
-        """Visualisasi data dengan anotasi nilai dan tema seaborn."""
-        for widget in parent.winfo_children():
-            widget.destroy()
-        fig, ax = plt.subplots(figsize=(12, 6))
-        palette = sns.color_palette("pastel")
+        if extended:
+            extra = [('Pendapatan Minimum', stats.minimum), ('Pendapatan Maksimum', stats.maximum)]
+            extra += [(f'{label} Pendapatan', stats.quantile(q)) for label, q in
+                      [('Persentil 25', 0.25), ('Median', 0.5), ('Persentil 75', 0.75),
+                       ('Persentil 90', 0.9), ('Persentil 99', 0.99)]]
+            summary = pd.concat([summary, pd.DataFrame(extra, columns=['Keterangan', 'Nilai'])],
+                                ignore_index=True)
+        return summary
+
+    @instrumented()
+    def draw_plot(self, series, kind, title, surface, layout=None):
+        """Visualisasi data dengan anotasi nilai dan tema seaborn.
+
+        layout memilih halaman ChartSurface; bawaannya satu halaman per jenis grafik.
+        """
+        ax, _ = surface.axes(layout or ('plot', kind))
+        palette = pastel_palette()
         if kind == 'pie':
+            ax.clear()
             if series.shape[0] > 1:
                 series.plot(kind=kind, ax=ax, autopct='%1.1f%%', labels=series.index, colors=palette)
                 ax.set_ylabel('')
             else:
                 ax.text(0.5, 0.5, 'Data tidak cukup untuk pie chart', ha='center')
+        elif kind == 'bar':
+            surface.bars(ax, 'bar', [str(label) for label in series.index], series.values, color=palette)
+            surface.annotate(ax, 'bar', range(len(series)), series.values, '{:,.0f}')
+            ax.set_xlabel(series.index.name or "")
+        elif kind == 'line':
+            series, unit = level_of_detail(series, surface.max_points(ax))
+            if unit != 'Harian':
+                title = f"{title} ({unit})"
+            marker = 'o' if len(series) <= LOD_MARKER_POINTS else None
+            surface.line(ax, 'line', series.index, series.values, marker=marker, linestyle='-', color='#007acc')
+            ax.set_xlabel(series.index.name or "")
+            format_rupiah_axis(ax)
         else:
+            ax.clear()
             series.plot(kind=kind, ax=ax, color=palette)
-            for i, (label, value) in enumerate(series.items()):
-                ax.text(i, value, f'{value:,.0f}', ha='center', va='bottom')
+            surface.annotate(ax, kind, range(len(series)), series.values, '{:,.0f}')
         ax.set_title(title)
-        fig.tight_layout()
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        return fig
+        surface.render()
+        return surface.figure
+
+
+QueryPlan = namedtuple('QueryPlan', ['source', 'start', 'end', 'products', 'columns', 'aggregate'])
+
+
+class Query:
+    """Rencana kueri malas: filter tanggal, produk dan kata kunci lalu (opsional) satu agregat.
+
+    Tidak ada yang dihitung sampai collect() atau count(). plan() menyusun rencana
+    teroptimasi: semua predikat digabung lalu didorong ke indeks tanggal (searchsorted)
+    dan posisi baris per produk, kata kunci diselesaikan ke daftar produk lewat indeks
+    trigram, hanya kolom yang dibutuhkan agregat yang diambil, dan agregat berupa
+    jumlah dijawab dari kubus bila tersedia. Setiap metode mengembalikan Query baru.
+    """
+    # agregat SalesAnalyzer -> kolom yang dibutuhkan
+    AGGREGATES = {
+        'total_sales_per_product': ['produk', 'jumlah_terjual'],
+        'income_per_product': ['produk', 'pendapatan'],
+        'daily_income': ['tanggal', 'pendapatan'],
+        'monthly_sales': ['tanggal', 'jumlah_terjual'],
+        'monthly_income': ['tanggal', 'pendapatan'],
+    }
+    # Cara predikat dijalankan, untuk explain()
+    DATE_INDEX = 'searchsorted indeks tanggal'
+    PRODUCT_INDEX = 'posisi baris per produk'
+
+    def __init__(self, handler, state=None):
+        self.handler = handler
+        # DataState DataHandler saat kueri dibuat; semua kueri turunannya membaca keadaan yang sama
+        self.state = state
+        self.start = None
+        self.end = None
+        self.product = None
+        self.keywords = ()
+        self.columns = None
+        self.aggregate_name = None
+        self.source = None
+        self.empty = False
+
+    def _replace(self, **changes):
+        query = copy.copy(self)
+        query.__dict__.update(changes)
+        return query
+
+    def where(self, start=None, end=None, product=None, keyword=''):
+        """Tambah predikat; predikat berulang digabung (irisan rentang, produk dan kata kunci)."""
+        changes = {}
+        if start is not None:
+            changes['start'] = start if self.start is None else max(self.start, start)
+        if end is not None:
+            changes['end'] = end if self.end is None else min(self.end, end)
+        if product is not None:
+            if self.product is not None and self.product != product:
+                changes['empty'] = True
+            changes['product'] = product
+        if keyword:
+            changes['keywords'] = self.keywords + (keyword.lower(),)
+        return self._replace(**changes)
+
+    def select(self, *columns):
+        return self._replace(columns=list(columns))
+
+    def aggregate(self, name):
+        if name not in self.AGGREGATES:
+            raise ValueError(f"Agregat tidak dikenal: {name}")
+        return self._replace(aggregate_name=name)
+
+    def from_cube(self):
+        """Paksa membaca kubus tanggal x produk, misalnya untuk ringkasan per tampilan."""
+        return self._replace(source='kubus')
+
+    def plan(self):
+        products = None
+        if self.empty:
+            products = []
+        elif self.product is not None or self.keywords:
+            products = [self.product] if self.product is not None else None
+            for keyword in self.keywords:
+                index = self.handler.search_index if self.state is None else self.state.search_index
+                matches = index.match(keyword)
+                products = matches if products is None else [p for p in products if p in matches]
+        source = self.source
+        if source is None:
+            source = 'kubus' if self.aggregate_name and self._has_cube() else 'data'
+        columns = self.columns
+        if self.aggregate_name:
+            columns = self.AGGREGATES[self.aggregate_name]
+        start, end = self.start, self.end
+        if start is not None and end is not None and start > end:
+            products = []
+        return QueryPlan(source, start, end, products, columns, self.aggregate_name)
+
+    def explain(self):
+        plan = self.plan()
+        lines = [f"sumber: {'kubus tanggal x produk' if plan.source == 'kubus' else 'data transaksi'}"]
+        if plan.start is not None or plan.end is not None:
+            lines.append(f"tanggal: {plan.start or '-'} .. {plan.end or '-'} ({self.DATE_INDEX})")
+        if plan.products is not None:
+            via = ', kata kunci lewat indeks trigram' if self.keywords else ''
+            lines.append(f"produk: {len(plan.products)} produk ({self.PRODUCT_INDEX}{via})")
+        lines.append(f"kolom: {', '.join(plan.columns) if plan.columns else 'semua'}")
+        if plan.aggregate:
+            lines.append(f"agregat: {plan.aggregate}")
+        return "\n".join(lines)
+
+    def _has_cube(self):
+        return self.state.cube is not None
+
+    def _target(self, plan):
+        if plan.source == 'kubus':
+            cube = self.state.cube
+            return cube.frame, cube._dates, cube._product_rows
+        return self.state.data, self.state.dates, self.state.product_rows
+
+    def _positions(self, plan, dates, product_rows):
+        if plan.products is None:
+            return sorted_positions(dates, product_rows, plan.start, plan.end)
+        return product_positions(dates, product_rows, plan.products, plan.start, plan.end)
+
+    def count(self):
+        """Jumlah baris yang lolos predikat, tanpa mengambil datanya."""
+        plan = self.plan()._replace(source='data')
+        if self.state.data is None:
+            return 0
+        positions = self._positions(plan, self.state.dates, self.state.product_rows)
+        if isinstance(positions, slice):
+            return len(range(*positions.indices(len(self.state.dates))))
+        return len(positions)
+
+    @instrumented()
+    def collect(self):
+        """Jalankan rencana: DataFrame hasil filter, atau Series bila ada agregat."""
+        plan = self.plan()
+        frame, dates, product_rows = self._target(plan)
+        if frame is None:
+            return pd.DataFrame()
+        positions = self._positions(plan, dates, product_rows)
+        if plan.columns is not None:
+            columns = [frame.columns.get_loc(col) for col in plan.columns]
+            result = frame.iloc[positions, columns]
+        else:
+            result = frame.iloc[positions]
+        if plan.aggregate:
+            return getattr(SalesAnalyzer(result), plan.aggregate)()
+        return result
+
+    def summary(self, data=None, cube=None):
+        """SummaryStats (tanpa kuantil) untuk baris yang lolos predikat.
+
+        data dan cube boleh diisi bila hasil collect() keduanya sudah ada.
+        """
+        data = self.collect() if data is None else data
+        cube = self.from_cube().collect() if cube is None else cube
+        return SummaryStats.from_frame(data, quantiles=False, cube=cube)
+
+
+# Kolom angka pada tabel SQLite; kolom lain disimpan sebagai teks
+STORE_NUMERIC = ('jumlah_terjual', 'harga_satuan', 'pendapatan')
+
+
+def sql_name(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def sql_timestamp(value):
+    # Format tetap sehingga urutan teks sama dengan urutan waktu
+    return pd.Timestamp(value).strftime(SQL_TIME_FORMAT)
+
+
+class SalesStore:
+    """Penyimpanan penjualan di SQLite untuk riwayat yang lebih besar dari RAM.
+
+    Transaksi disimpan terurut menurut tanggal (id = posisi + 1) dengan indeks pada
+    tanggal dan (produk, tanggal), ditambah tabel kubus tanggal x produk. Filter dan
+    agregat dijalankan sebagai kueri SQL berindeks lewat StoreQuery; hanya hasil
+    agregat dan jendela baris yang sedang ditampilkan yang dimuat ke memori.
+    Antarmukanya mengikuti DataHandler (query, products, stats, version) sehingga
+    GUI dan ReportEngine dapat memakai keduanya.
+    """
+    # Semua koneksi yang terbuka per file database, dari instance dan thread mana pun,
+    # agar bisa ditutup sebelum file diganti (Windows menolak mengganti file yang terbuka)
+    _connections = {}
+    _connections_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self.version = 0
+        self.last_error = None
+        self.skipped_files = []
+        self.source = None
+        self.stats = None
+        self.columns = []
+        self.search_index = ProductIndex()
+        self._products = []
+        self._cube = None
+        self._local = threading.local()
+        if os.path.exists(path):
+            try:
+                self.open()
+            except (sqlite3.Error, ValueError, KeyError) as e:
+                # Bukan database penjualan atau formatnya lama; masih bisa dibuat ulang dengan load_csv
+                logging.error(f"Gagal membuka database {path}: {e}")
+                self.last_error = str(e)
+                self.columns = []
+                self.stats = None
+
+    def connect(self):
+        """Koneksi per thread; koneksi yang sudah ditutup oleh close_all dibuka ulang."""
+        conn = getattr(self._local, 'conn', None)
+        with self._connections_lock:
+            live = conn is not None and conn in self._connections.get(os.path.abspath(self.path), ())
+        if not live:
+            conn = self.new_connection()
+            self._local.conn = conn
+        return conn
+
+    def new_connection(self):
+        """Koneksi baru yang terdaftar untuk close_all; dipakai satu thread pada satu waktu."""
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connections_lock:
+            self._connections.setdefault(os.path.abspath(self.path), set()).add(conn)
+        return conn
+
+    def release(self, conn):
+        """Tutup satu koneksi dari new_connection dan hapus dari daftar."""
+        with self._connections_lock:
+            self._connections.get(os.path.abspath(self.path), set()).discard(conn)
+        conn.close()
+
+    @classmethod
+    def close_all(cls, path):
+        """Tutup semua koneksi ke file database path."""
+        with cls._connections_lock:
+            connections = cls._connections.pop(os.path.abspath(path), set())
+        for conn in connections:
+            conn.close()
+
+    def open(self):
+        conn = self.connect()
+        meta = dict(conn.execute("SELECT kunci, nilai FROM meta").fetchall())
+        self.columns = json.loads(meta['kolom'])
+        try:
+            self.stats = SummaryStats.from_dict(json.loads(meta['statistik']))
+        except (TypeError, ValueError, KeyError):
+            raise ValueError("Format statistik database tidak dikenal; buat ulang database dari CSV")
+        self._products = [row[0] for row in conn.execute("SELECT DISTINCT produk FROM kubus ORDER BY produk")]
+        self.search_index = ProductIndex(self._products)
+        self._cube = None
+        self.version = next(_data_versions)
+
+    @instrumented()
+    def load_csv(self, filepath, chunksize=STREAM_CHUNKSIZE, progress=None):
+        """Muat CSV ke database (dibuat ulang) per potongan, dengan memori sebanding satu potongan.
+
+        Duplikat dibuang lintas potongan lewat indeks unik hash baris di SQLite.
+        """
+        tmp_path = self.path + '.tmp'
+        try:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            conn = sqlite3.connect(tmp_path)
+            try:
+                self._ingest(conn, filepath, chunksize, progress)
+            finally:
+                conn.close()
+            # Termasuk koneksi instance lain (misalnya store lama yang masih ditampilkan GUI)
+            self.close_all(self.path)
+            os.replace(tmp_path, self.path)
+            self.open()
+            return True
+        except TaskCancelled:
+            raise
+        except Exception as e:
+            logging.error(f"Gagal memuat ke database: {e}")
+            self.last_error = str(e)
+            return False
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _ingest(self, conn, filepath, chunksize, progress):
+        # File sementara dibangun ulang dari CSV, jadi jurnal tidak diperlukan
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        step = (lambda fraction: progress(fraction * 0.7)) if progress is not None else None
+        columns = None
+        for chunk in DataHandler.clean_chunks(filepath, chunksize, step):
+            hashes = row_hashes(chunk).view(np.int64)
+            chunk = derive_columns(chunk).drop(columns='bulan')
+            if columns is None:
+                columns = list(chunk.columns)
+                definition = ', '.join(f"{sql_name(col)} {'NUMERIC' if col in STORE_NUMERIC else 'TEXT'}"
+                                       for col in columns)
+                conn.execute(f"CREATE TABLE mentah (hash INTEGER, {definition})")
+                conn.execute("CREATE UNIQUE INDEX mentah_hash ON mentah(hash)")
+            values = [hashes.tolist()]
+            for col in columns:
+                series = chunk[col]
+                if col == 'tanggal':
+                    values.append(series.dt.strftime(SQL_TIME_FORMAT).tolist())
+                elif col in STORE_NUMERIC:
+                    values.append(series.tolist())
+                else:
+                    values.append(series.astype(object).where(series.notna(), None).tolist())
+            placeholders = ', '.join('?' * (len(columns) + 1))
+            conn.executemany(f"INSERT OR IGNORE INTO mentah VALUES ({placeholders})", zip(*values))
+        if columns is None:
+            raise ValueError("File kosong")
+
+        names = ', '.join(sql_name(col) for col in columns)
+        # Urut tanggal (stabil menurut urutan file) sehingga id berurutan sama dengan posisi baris
+        conn.execute(f"CREATE TABLE penjualan (id INTEGER PRIMARY KEY, {definition})")
+        conn.execute(f"INSERT INTO penjualan ({names}) SELECT {names} FROM mentah ORDER BY tanggal, rowid")
+        conn.execute("DROP TABLE mentah")
+        conn.execute("CREATE INDEX penjualan_tanggal ON penjualan(tanggal)")
+        conn.execute("CREATE INDEX penjualan_produk ON penjualan(produk, tanggal)")
+        conn.execute("""CREATE TABLE kubus AS
+                        SELECT tanggal, produk, SUM(jumlah_terjual) AS jumlah_terjual,
+                               SUM(pendapatan) AS pendapatan
+                        FROM penjualan GROUP BY tanggal, produk ORDER BY tanggal, produk""")
+        conn.execute("CREATE INDEX kubus_tanggal ON kubus(tanggal)")
+        conn.execute("CREATE INDEX kubus_produk ON kubus(produk, tanggal)")
+        if progress is not None:
+            progress(0.8)
+
+        # Statistik lengkap (termasuk sketsa kuantil) dihitung sekali per potongan lalu disimpan
+        parts = []
+        for part in pd.read_sql_query("SELECT tanggal, produk, jumlah_terjual, pendapatan FROM penjualan",
+                                      conn, chunksize=chunksize):
+            part['tanggal'] = pd.to_datetime(part['tanggal'], format=SQL_TIME_FORMAT)
+            parts.append(SummaryStats.from_frame(part))
+        conn.execute("CREATE TABLE meta (kunci TEXT PRIMARY KEY, nilai TEXT)")
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ('kolom', json.dumps(columns)),
+            ('statistik', json.dumps(SummaryStats.combine(parts).to_dict())),
+            ('sumber', os.path.abspath(filepath)),
+        ])
+        conn.commit()
+        if progress is not None:
+            progress(1.0)
+
+    def read_frame(self, sql, params=()):
+        """Jalankan SELECT dan kembalikan DataFrame dengan kolom tanggal bertipe datetime."""
+        frame = pd.read_sql_query(sql, self.connect(), params=list(params))
+        if 'tanggal' in frame:
+            frame['tanggal'] = pd.to_datetime(frame['tanggal'], format=SQL_TIME_FORMAT)
+        return frame
+
+    def get_data(self):
+        return StoreView(self, '', []) if self.columns else None
+
+    def products(self):
+        return list(self._products)
+
+    @property
+    def cube(self):
+        """Kubus tanggal x produk di memori (jauh lebih kecil dari data transaksi)."""
+        if self._cube is None and self.columns:
+            self._cube = SalesCube(self.read_frame("SELECT * FROM kubus ORDER BY tanggal, produk"))
+        return self._cube
+
+    def query(self):
+        return StoreQuery(self)
+
+    def filter_by_date(self, start, end, product=None):
+        return self.query().where(start, end, product).collect()
+
+    def search(self, keyword, start=None, end=None, product=None):
+        return self.query().where(start, end, product, keyword).collect()
+
+
+class StoreQuery(Query):
+    """Query yang dijalankan sebagai SQL pada SalesStore.
+
+    Predikat menjadi klausa WHERE berindeks, agregat menjadi GROUP BY pada tabel kubus,
+    dan baris transaksi dikembalikan sebagai StoreView yang belum dimuat.
+    """
+    DATE_INDEX = 'indeks SQLite tanggal'
+    PRODUCT_INDEX = 'indeks SQLite (produk, tanggal)'
+    # agregat -> (ekspresi kunci, kolom nilai)
+    SQL_AGGREGATES = {
+        'total_sales_per_product': ('produk', 'jumlah_terjual'),
+        'income_per_product': ('produk', 'pendapatan'),
+        'daily_income': ('tanggal', 'pendapatan'),
+        'monthly_sales': ('substr(tanggal, 1, 7)', 'jumlah_terjual'),
+        'monthly_income': ('substr(tanggal, 1, 7)', 'pendapatan'),
+    }
+
+    def _has_cube(self):
+        return True
+
+    def where_clause(self, plan=None):
+        plan = plan or self.plan()
+        clauses, params = [], []
+        if plan.start is not None:
+            clauses.append("tanggal >= ?")
+            params.append(sql_timestamp(plan.start))
+        if plan.end is not None:
+            clauses.append("tanggal <= ?")
+            params.append(sql_timestamp(plan.end))
+        if plan.products is not None:
+            if plan.products:
+                clauses.append(f"produk IN ({', '.join('?' * len(plan.products))})")
+                params.extend(plan.products)
+            else:
+                clauses.append("0")
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def sql(self):
+        plan = self.plan()
+        where, params = self.where_clause(plan)
+        if plan.aggregate:
+            key, value = self.SQL_AGGREGATES[plan.aggregate]
+            return f"SELECT {key} AS kunci, SUM({value}) AS nilai FROM kubus{where} GROUP BY kunci ORDER BY kunci", params
+        table = 'kubus' if plan.source == 'kubus' else 'penjualan'
+        columns = ', '.join(sql_name(col) for col in plan.columns) if plan.columns else '*'
+        return f"SELECT {columns} FROM {table}{where}", params
+
+    def explain(self):
+        sql, params = self.sql()
+        return super().explain() + f"\nSQL: {sql}\nparameter: {params}"
+
+    def count(self):
+        if not self.handler.columns:
+            return 0
+        where, params = self.where_clause()
+        return self.handler.connect().execute(f"SELECT COUNT(*) FROM penjualan{where}", params).fetchone()[0]
+
+    @instrumented()
+    def collect(self):
+        """Series untuk agregat, DataFrame untuk kubus, atau StoreView untuk baris transaksi."""
+        if not self.handler.columns:
+            return pd.DataFrame()
+        plan = self.plan()
+        if plan.aggregate:
+            key, value = self.SQL_AGGREGATES[plan.aggregate]
+            sql, params = self.sql()
+            frame = pd.read_sql_query(sql, self.handler.connect(), params=params)
+            index = frame['kunci']
+            if key == 'tanggal':
+                index = pd.DatetimeIndex(pd.to_datetime(index, format=SQL_TIME_FORMAT), name='tanggal')
+            elif key == 'produk':
+                index = pd.Index(index, name='produk')
+            else:
+                index = pd.PeriodIndex(index, freq='M', name='tanggal')
+            return pd.Series(frame['nilai'].to_numpy(), index=index, name=value)
+        if plan.source == 'kubus':
+            sql, params = self.sql()
+            return self.handler.read_frame(sql + " ORDER BY tanggal, produk", params)
+        where, params = self.where_clause(plan)
+        return StoreView(self.handler, where, params, columns=plan.columns,
+                         date_range=plan.products is None)
+
+    def summary(self, data=None, cube=None):
+        """SummaryStats dihitung di SQLite: jumlah, rata-rata, M2 dua lintasan, min/maks dan total per produk."""
+        stats = SummaryStats()
+        if not self.handler.columns:
+            return stats
+        conn = self.handler.connect()
+        where, params = self.where_clause()
+        count, total, low, high, start, end = conn.execute(
+            "SELECT COUNT(*), SUM(pendapatan), MIN(pendapatan), MAX(pendapatan), MIN(tanggal), MAX(tanggal) "
+            f"FROM penjualan{where}", params).fetchone()
+        if not count:
+            return stats
+        stats.count = count
+        stats.mean = total / count
+        stats.m2 = conn.execute(f"SELECT SUM((pendapatan - ?) * (pendapatan - ?)) FROM penjualan{where}",
+                                [stats.mean, stats.mean] + params).fetchone()[0]
+        stats.minimum, stats.maximum = float(low), float(high)
+        stats.start = pd.to_datetime(start, format=SQL_TIME_FORMAT)
+        stats.end = pd.to_datetime(end, format=SQL_TIME_FORMAT)
+        totals = pd.read_sql_query(
+            f"SELECT produk, SUM(jumlah_terjual) AS jumlah_terjual, SUM(pendapatan) AS pendapatan "
+            f"FROM kubus{where} GROUP BY produk ORDER BY produk", conn, params=params).set_index('produk')
+        totals.index = totals.index.astype(object)
+        stats.units = totals['jumlah_terjual']
+        stats.income = totals['pendapatan']
+        return stats
+
+
+class StoreView:
+    """Baris transaksi hasil filter SalesStore yang belum dimuat ke memori.
+
+    Hanya jumlah baris dan jendela yang diminta (misalnya oleh VirtualTable) yang
+    dibaca. Tanpa filter produk, baris hasil filter tanggal menempati rentang id yang
+    berurutan, sehingga jendelanya dibaca lewat id. Urutan lain (pengurutan kolom
+    atau filter produk) dibentuk sekali oleh prepare() sebagai tabel sementara id
+    per posisi, sehingga setiap jendela dibaca lewat rentang posisi, tanpa OFFSET.
+    """
+    def __init__(self, store, where, params, order=None, columns=None, date_range=True):
+        self.store = store
+        self.where = where
+        self.params = list(params)
+        self.order = order
+        self.columns = columns or store.columns
+        self.date_range = date_range
+        self._len = None
+        self._first_id = None
+        self._positions = None
+
+    def __len__(self):
+        if self._len is None:
+            if not self.where and self.store.stats is not None:
+                self._len = self.store.stats.count
+            else:
+                sql = f"SELECT COUNT(*) FROM penjualan{self.where}"
+                self._len = self.store.connect().execute(sql, self.params).fetchone()[0]
+        return self._len
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def sorted(self, col, reverse=False):
+        """View yang sama dengan urutan kolom lain; urutan asli (tanggal) dipakai sebagai pemecah seri."""
+        if col not in self.store.columns:
+            raise ValueError(f"Kolom tidak dikenal: {col}")
+        order = f"{sql_name(col)} {'DESC' if reverse else 'ASC'}, id"
+        return StoreView(self.store, self.where, self.params, order, self.columns, self.date_range)
+
+    @property
+    def by_id(self):
+        """True bila jendela bisa dibaca langsung lewat rentang id."""
+        return self.order is None and self.date_range
+
+    def prepare(self):
+        """Bentuk urutan baris sekali: tabel sementara (posisi, id) pada koneksi milik view ini.
+
+        Boleh dipanggil dari thread latar; koneksinya lalu dipakai thread lain secara
+        bergantian, tidak bersamaan. Mengembalikan view ini.
+        """
+        if self.by_id or self._positions is not None:
+            return self
+        conn = self.store.new_connection()
+        conn.execute("CREATE TEMP TABLE urutan (posisi INTEGER PRIMARY KEY, id INTEGER)")
+        conn.execute(f"INSERT INTO urutan (id) SELECT id FROM penjualan{self.where} "
+                     f"ORDER BY {self.order or 'tanggal, id'}", self.params)
+        self._len = conn.execute("SELECT COUNT(*) FROM urutan").fetchone()[0]
+        self._positions = conn
+        # Koneksi (dan tabel sementaranya) ditutup bersama view
+        weakref.finalize(self, self.store.release, conn)
+        return self
+
+    def window(self, start, stop):
+        """Baris ke-start sampai sebelum stop sebagai DataFrame."""
+        stop = min(stop, len(self))
+        if stop <= start:
+            return self.store.read_frame(f"SELECT {self._select()} FROM penjualan WHERE 0")
+        if self.by_id:
+            if self._first_id is None:
+                row = self.store.connect().execute(
+                    f"SELECT id FROM penjualan{self.where} ORDER BY tanggal, id LIMIT 1", self.params).fetchone()
+                self._first_id = row[0]
+            first = self._first_id + start
+            sql = f"SELECT {self._select()} FROM penjualan WHERE id BETWEEN ? AND ? ORDER BY id"
+            frame = self.store.read_frame(sql, [first, self._first_id + stop - 1])
+        else:
+            self.prepare()
+            columns = ', '.join(f"p.{sql_name(col)}" for col in self.columns)
+            sql = (f"SELECT {columns} FROM urutan u JOIN penjualan p ON p.id = u.id "
+                   f"WHERE u.posisi BETWEEN ? AND ? ORDER BY u.posisi")
+            frame = pd.read_sql_query(sql, self._positions, params=[start + 1, stop])
+            if 'tanggal' in frame:
+                frame['tanggal'] = pd.to_datetime(frame['tanggal'], format=SQL_TIME_FORMAT)
+        if 'tanggal' in frame:
+            frame['bulan'] = frame['tanggal'].dt.to_period('M')
+        return frame
+
+    def _select(self):
+        return ', '.join(sql_name(col) for col in self.columns)
+
+    def to_frame(self):
+        """Muat seluruh baris view ke memori; hanya untuk hasil yang sudah kecil."""
+        return self.window(0, len(self))
+
+
+# Level of detail grafik garis: titik per piksel, batas penanda dan batas anotasi
+LOD_PIXELS_PER_POINT = 2
+LOD_MARKER_POINTS = 60
+MAX_ANNOTATIONS = 30
+
+
+def lttb_indices(x, y, threshold):
+    """Largest-Triangle-Three-Buckets: posisi titik yang mempertahankan bentuk dan puncak deret."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    edges = np.append(edges, n)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2]
+        if end <= start:
+            continue
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        selected.append(a)
+    selected.append(n - 1)
+    return np.asarray(selected)
+
+
+def level_of_detail(series, max_points):
+    """Sederhanakan deret harian agar jumlah titik tidak melebihi max_points.
+
+    Rentang panjang dijumlahkan per minggu lalu per bulan; bila masih terlalu
+    banyak, titik dipilih dengan LTTB sehingga puncak tetap terlihat.
+    Mengembalikan (deret, satuan waktu).
+    """
+    unit = 'Harian'
+    if len(series) > max_points and isinstance(series.index, pd.DatetimeIndex):
+        for rule, name in [('W', 'Mingguan'), ('MS', 'Bulanan')]:
+            series, unit = series.resample(rule).sum(), name
+            if len(series) <= max_points:
+                break
+    if len(series) > max_points:
+        x = series.index.asi8.astype(float) if isinstance(series.index, pd.DatetimeIndex) else np.arange(len(series), dtype=float)
+        series = series.iloc[lttb_indices(x, series.to_numpy(dtype=float), max_points)]
+    return series, unit
+
+
+def format_rupiah_axis(ax):
+    import matplotlib.ticker as mtick
+    ax.yaxis.set_major_formatter(mtick.FuncFormatter(lambda x, _: f'{int(x):,}'))
+
+
+class ChartSurface:
+    """Satu FigureCanvasTkAgg yang dipakai ulang untuk semua grafik, dengan satu Figure per tata letak.
+
+    Figure setiap tata letak (halaman) disimpan, maksimal MAX_PAGES, sehingga kembali
+    ke tata letak yang pernah digambar cukup menukar Figure pada kanvas. Bila halaman
+    terakhir digambar dengan tanda (signature) yang sama, show() menampilkannya tanpa
+    menggambar ulang. Selebihnya data artist (garis, tinggi batang) diperbarui di
+    tempat lalu digambar dengan draw_idle. Tanpa parent, kanvas memakai Agg sehingga
+    bisa dipakai tanpa layar.
+    """
+    MAX_PAGES = 8
+
+    def __init__(self, parent=None, figsize=(12, 6)):
+        from matplotlib.figure import Figure
+        self._figure_class = Figure
+        self.figure = Figure(figsize=figsize)
+        if parent is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            self.canvas = FigureCanvasAgg(self.figure)
+        else:
+            self.canvas = FigureCanvasTkAgg(self.figure, master=parent)
+            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.layout = None
+        self._axes = None
+        self.artists = {}
+        self.signature = None
+        # tata letak -> (figure, axes, artists, signature), urutan = terakhir dipakai
+        self._pages = {}
+
+    def _attach(self, figure):
+        # Ukuran mengikuti kanvas saat ini (bisa sudah diubah pengguna)
+        figure.set_size_inches(self.figure.get_size_inches(), forward=False)
+        figure.set_canvas(self.canvas)
+        self.canvas.figure = figure
+        self.figure = figure
+
+    def axes(self, layout, nrows=1, ncols=1):
+        """Axes untuk tata letak tertentu; fresh bernilai True bila baru dibuat."""
+        if self.layout == layout:
+            return self._axes, False
+        if self.layout is not None:
+            self._pages[self.layout] = (self.figure, self._axes, self.artists, self.signature)
+        page = self._pages.pop(layout, None)
+        self.layout = layout
+        if page is not None:
+            figure, self._axes, self.artists, self.signature = page
+            self._attach(figure)
+            return self._axes, False
+        figure = self._figure_class(dpi=self.figure.dpi)
+        self._attach(figure)
+        self._axes = figure.subplots(nrows, ncols, squeeze=True)
+        self.artists = {}
+        self.signature = None
+        while len(self._pages) >= self.MAX_PAGES:
+            # Lepas artist dan axes halaman terlama secara eksplisit
+            evicted = self._pages.pop(next(iter(self._pages)))
+            evicted[0].clear()
+        return self._axes, True
+
+    def show(self, layout, signature):
+        """Tampilkan halaman yang terakhir digambar dengan signature yang sama; False bila harus digambar."""
+        if self.layout == layout:
+            current = self.signature
+        else:
+            current = self._pages.get(layout, (None, None, None, None))[3]
+        if signature is None or current != signature:
+            return False
+        self.axes(layout)
+        self.canvas.draw_idle()
+        return True
+
+    def max_points(self, ax):
+        """Jumlah titik yang masih bermakna untuk lebar axes dalam piksel."""
+        return max(100, int(ax.bbox.width / LOD_PIXELS_PER_POINT))
+
+    def line(self, ax, name, x, y, **style):
+        line = self.artists.get(name)
+        if line is None:
+            line, = ax.plot(x, y, **style)
+            self.artists[name] = line
+        else:
+            line.set_data(x, y)
+            # marker=None berarti tanpa penanda pada plot(), tetapi ditolak oleh set()
+            if 'marker' in style and style['marker'] is None:
+                style['marker'] = ''
+            line.set(**style)
+            ax.relim()
+            ax.autoscale_view()
+        return line
+
+    def bars(self, ax, name, labels, heights, rotation=90, **style):
+        """Batang dengan kategori yang sama cukup diganti tingginya."""
+        entry = self.artists.get(name)
+        if entry is not None and entry[0] == labels:
+            for bar, height in zip(entry[1], heights):
+                bar.set_height(height)
+            ax.relim()
+            ax.autoscale_view()
+            return entry[1]
+        ax.clear()
+        self.artists.pop(name + ':text', None)
+        positions = range(len(labels))
+        container = ax.bar(positions, heights, **style)
+        ax.set_xticks(positions, labels, rotation=rotation)
+        self.artists[name] = (labels, container)
+        return container
+
+    def annotate(self, ax, name, xs, ys, fmt, limit=MAX_ANNOTATIONS, **style):
+        """Label nilai; bila terlalu banyak hanya nilai terbesar yang diberi label."""
+        for text in self.artists.pop(name + ':text', []):
+            text.remove()
+        xs, ys = list(xs), np.asarray(ys)
+        keep = np.sort(np.argsort(ys, kind='stable')[::-1][:limit]) if len(ys) > limit else range(len(ys))
+        self.artists[name + ':text'] = [
+            ax.text(xs[i], ys[i], fmt.format(ys[i]), ha='center', va='bottom', **style) for i in keep
+        ]
+
+    def render(self, pad=1.08, signature=None):
+        self.figure.tight_layout(pad=pad)
+        self.canvas.draw_idle()
+        self.signature = signature
+
+
+class VirtualTable:
+    """Tampilan virtual untuk Treeview: DataFrame tetap menjadi penyimpan data,
+    hanya baris di jendela gulir (ditambah sedikit penyangga) yang dibuat sebagai item Tk.
+
+    Data juga boleh berupa StoreView; jendela dan pengurutan lalu dibaca dari SQLite.
+    """
+    BUFFER_ROWS = 5
+
+    def __init__(self, tree, scrollbar, rowheight=24):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.rowheight = rowheight
+        self.columns = list(tree['columns'])
+        self.data = pd.DataFrame(columns=self.columns)
+        self.offset = 0
+        self.order = None
+        self._sort_cache = {}
+
+        self.scrollbar.configure(command=self.on_scroll)
+        self.tree.bind('<Configure>', lambda e: self.render())
+        self.tree.bind('<MouseWheel>', self.on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll_by(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_by(3))
+
+    def set_data(self, data):
+        self.data = data
+        self.offset = 0
+        self.order = None
+        self._sort_cache = {}
+        self.render()
+
+    def sort(self, col, reverse=False):
+        """Urutkan berdasarkan tipe asli kolom (stabil); permutasi disimpan per kolom dan arah."""
+        if isinstance(self.data, StoreView):
+            self.show_sorted(self.data.sorted(col, reverse).prepare())
+            return
+        key = (col, reverse)
+        if key not in self._sort_cache:
+            values = self.data[col].reset_index(drop=True)
+            if isinstance(values.dtype, pd.CategoricalDtype) and not values.cat.categories.is_monotonic_increasing:
+                values = values.cat.reorder_categories(values.cat.categories.sort_values())
+            ordered = values.sort_values(ascending=not reverse, kind='stable', na_position='last')
+            self._sort_cache[key] = ordered.index.to_numpy()
+        self.order = self._sort_cache[key]
+        self.offset = 0
+        self.render()
+
+    def show_sorted(self, view):
+        """Tampilkan StoreView yang urutannya sudah dibentuk (lihat StoreView.prepare)."""
+        self.data = view
+        self.offset = 0
+        self.render()
+
+    def visible_rows(self):
+        return max(1, self.tree.winfo_height() // self.rowheight)
+
+    def scroll_by(self, rows):
+        self.scroll_to(self.offset + rows)
+        return "break"
+
+    def scroll_to(self, offset):
+        last = max(0, len(self.data) - self.visible_rows() + 1)
+        offset = min(max(0, int(offset)), last)
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def on_scroll(self, action, value, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(value) * len(self.data))
+        elif action == 'scroll':
+            step = self.visible_rows() if unit == 'pages' else 1
+            self.scroll_to(self.offset + int(value) * step)
+
+    def on_mousewheel(self, event):
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def format_window(self, window):
+        """Format nilai per kolom secara tervektorisasi, hanya untuk baris di jendela."""
+        formatted = []
+        for col in self.columns:
+            values = window[col]
+            if pd.api.types.is_datetime64_any_dtype(values):
+                values = values.dt.strftime('%Y-%m-%d')
+            formatted.append(values.astype(str).tolist())
+        return list(zip(*formatted))
+
+    def render(self):
+        total = len(self.data)
+        stop = self.offset + self.visible_rows() + self.BUFFER_ROWS
+        if isinstance(self.data, StoreView):
+            window = self.data.window(self.offset, stop)
+        elif self.order is None:
+            window = self.data.iloc[self.offset:stop]
+        else:
+            window = self.data.iloc[self.order[self.offset:stop]]
+        rows = self.format_window(window)
+
+        # Pakai ulang item yang sudah ada, cukup ganti nilainya
+        items = self.tree.get_children()
+        for i, values in enumerate(rows):
+            tag = 'even' if (self.offset + i) % 2 == 0 else 'odd'
+            if i < len(items):
+                self.tree.item(items[i], values=values, tags=(tag,))
+            else:
+                self.tree.insert("", tk.END, values=values, tags=(tag,))
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+        self.tree.yview_moveto(0)
+
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible_rows()) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+# Hasil filter yang dipakai bersama oleh tabel, ringkasan dan grafik
+ViewState = namedtuple('ViewState', ['data', 'cube', 'stats', 'summary'])
+
 
 class MainAppGUI:
+    VIEW_CACHE_SIZE = 16
+
+    # Deret SalesAnalyzer yang dibutuhkan setiap pilihan dashboard
+    DASHBOARD_SERIES = {
+        "Pie Pendapatan": ['income_per_product'],
+        "Total Penjualan Bulanan": ['monthly_sales'],
+        "Pendapatan Bulanan": ['monthly_income'],
+        "Semua": ['monthly_sales', 'monthly_income', 'income_per_product'],
+    }
+
     def __init__(self, root):
         self.root = root
         self.root.title("Aplikasi Analisis Penjualan")
         self.root.state('zoomed')
-        self.data_handler = DataHandler()
+        self.cache = DataCache()
+        self.data_handler = DataHandler(cache=self.cache)
         self.fig = None
+        self._views = {}
+        self._views_lock = threading.Lock()
+        self._follow_job = None
+        self._search_job = None
+        self._status_sequence = 0
+        # Seri panel dashboard per keadaan filter (termasuk versi data), dihitung paralel
+        self._panels = {}
+        self._panels_lock = threading.Lock()
+        self._panel_pool = ThreadPoolExecutor(max_workers=len(self.DASHBOARD_SERIES["Semua"]),
+                                              thread_name_prefix='panel')
 
         self.build_gui()
+        self.tasks = TaskRunner(self.root, on_progress=self.show_task_progress, on_idle=self.on_tasks_idle)
+        self.root.after(STATUS_POLL_MS, self.refresh_status)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def build_gui(self):
         # Tambahkan styling Treeview
@@ -159,6 +2283,12 @@ class MainAppGUI:
 
         ttk.Label(header_frame, text="📊 Dashboard Penjualan Sepatu", font=("Helvetica", 16, "bold"), background="#f0f0f0").pack(side=tk.LEFT)
 
+        # Indikator tugas latar
+        self.cancel_button = ttk.Button(header_frame, text="Batal", command=self.cancel_tasks, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.RIGHT, padx=5)
+        self.progress = ttk.Progressbar(header_frame, length=200, mode='determinate')
+        self.progress.pack(side=tk.RIGHT, padx=5)
+
         control_frame = ttk.Frame(self.root)
         control_frame.pack(fill=tk.X, padx=10, pady=5)
 
@@ -174,18 +2304,25 @@ class MainAppGUI:
         self.product_filter = ttk.Combobox(control_frame, values=["Semua"], state="readonly")
         self.product_filter.current(0)
         self.product_filter.pack(side=tk.LEFT, padx=5)
-        self.product_filter.bind("<<ComboboxSelected>>", lambda e: (self.update_table(self.filter_data()), self.update_summary()))
+        self.product_filter.bind("<<ComboboxSelected>>", lambda e: self.update_table(self.get_view()))
 
         for text, cmd, color in [
             ("Load CSV", self.load_data, "#007bff"),
+            ("Load Folder", self.load_folder, "#0056b3"),
+            ("Load Database", self.load_database, "#003d80"),
             ("Produk Terjual", self.analyze_sales, "#28a745"),
             ("Pendapatan Harian", self.analyze_income, "#17a2b8"),
             ("Simpan Statistik", self.save_summary, "#6c757d"),
-            ("Simpan Grafik", self.save_graph, "#343a40")
+            ("Simpan Grafik", self.save_graph, "#343a40"),
+            ("Laporan Massal", self.save_bulk_reports, "#5a3d80")
         ]:
             btn = tk.Button(control_frame, text=text, command=cmd, bg=color, fg="white", font=("Segoe UI", 9, "bold"))
             btn.pack(side=tk.LEFT, padx=5)
 
+        self.follow_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame, text="Pantau File", variable=self.follow_var,
+                        command=self.toggle_follow).pack(side=tk.LEFT, padx=5)
+
         self.view_var = tk.StringVar()
         self.view_dropdown = ttk.Combobox(control_frame, textvariable=self.view_var,
             values=["Semua", "Pie Pendapatan", "Total Penjualan Bulanan", "Pendapatan Bulanan"],
@@ -197,6 +2334,16 @@ class MainAppGUI:
         self.summary_label = ttk.Label(self.root, text="Ringkasan: Belum ada data", font=("Segoe UI", 10, "bold"))
         self.summary_label.pack(pady=(0, 10))
 
+        # Status bar profil: waktu aksi terakhir, kontrol profil detail dan ekspor catatan waktu
+        status_frame = ttk.Frame(self.root)
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 5))
+        self.status_label = ttk.Label(status_frame, text="Siap", font=("Segoe UI", 9))
+        self.status_label.pack(side=tk.LEFT)
+        ttk.Button(status_frame, text="Ekspor Timing", command=self.export_timings).pack(side=tk.RIGHT, padx=5)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(status_frame, text="Profil Detail (memori + cProfile)", variable=self.profile_var,
+                        command=self.toggle_profiling).pack(side=tk.RIGHT, padx=5)
+
         self.tab_control = ttk.Notebook(self.root)
         self.table_tab = ttk.Frame(self.tab_control)
         self.canvas_tab = ttk.Frame(self.tab_control)
@@ -206,6 +2353,7 @@ class MainAppGUI:
 
         self.canvas_frame = ttk.Frame(self.canvas_tab)
         self.canvas_frame.pack(fill=tk.BOTH, expand=True)
+        self.chart = ChartSurface(self.canvas_frame)
         self.tombol_visualisasi()
 
         search_frame = ttk.Frame(self.table_tab)
@@ -214,7 +2362,10 @@ class MainAppGUI:
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         search_entry.pack(side=tk.LEFT, padx=5)
+        search_entry.bind('<Return>', lambda event: self.search_table())
         ttk.Button(search_frame, text="Cari", command=self.search_table).pack(side=tk.LEFT, padx=5)
+        # Cari sambil mengetik; ditunda sampai pengguna berhenti mengetik sejenak
+        self.search_var.trace_add('write', lambda *args: self.schedule_search())
 
         columns = ["tanggal", "produk", "jumlah_terjual", "harga_satuan", "pendapatan"]
         headings = ["Tanggal", "Produk", "Jumlah Terjual", "Harga Satuan", "Pendapatan"]
@@ -228,160 +2379,347 @@ class MainAppGUI:
             self.table.heading(col, text=head, command=lambda _col=col: self.sort_table(_col, False))
             self.table.column(col, anchor=anchor_pos, width=150)
 
-        vsb = ttk.Scrollbar(self.table_tab, orient="vertical", command=self.table.yview)
-        self.table.configure(yscrollcommand=vsb.set)
+        vsb = ttk.Scrollbar(self.table_tab, orient="vertical")
         vsb.pack(side='right', fill='y')
         self.table.pack(fill=tk.BOTH, expand=True, side='left')
+        self.table_view = VirtualTable(self.table, vsb, rowheight=24)
 
-    def update_table(self, data):
-        for row in self.table.get_children():
-            self.table.delete(row)
-        for i, (_, row) in enumerate(data.iterrows()):
-            tag = 'even' if i % 2 == 0 else 'odd'
-            self.table.insert("", tk.END, values=(
-                row['tanggal'].strftime('%Y-%m-%d'),
-                row['produk'],
-                row['jumlah_terjual'],
-                row['harga_satuan'],
-                row['pendapatan']
-            ), tags=(tag,))
-        self.update_summary()
-
-    def update_summary(self):
-        filtered = self.filter_data()
-        try:
-            total_transaksi = len(filtered)
-            total_unit = int(filtered['jumlah_terjual'].sum())
-            total_pendapatan = int(filtered['pendapatan'].sum())
-            top_produk = filtered.groupby('produk')['jumlah_terjual'].sum()
-
-            if not top_produk.empty:
-                sepatu_terlaris = top_produk.idxmax()
-                jumlah_terlaris = top_produk.max()
-            else:
-                sepatu_terlaris = '-'
-                jumlah_terlaris = 0
+    @instrumented()
+    def update_table(self, view):
+        self.table_view.set_data(view.data)
+        self.update_summary(view)
 
-            self.summary_label.config(
-                text=f"Transaksi: {total_transaksi} | Unit Terjual: {total_unit} | "
-                    f"Pendapatan: Rp {total_pendapatan:,} | "
-                    f"Sepatu Terlaris: {sepatu_terlaris} ({jumlah_terlaris} unit)"
-            )
-        except Exception as e:
-            self.summary_label.config(text=f"Ringkasan gagal dimuat: {e}")
+    @instrumented()
+    def update_summary(self, view=None):
+        view = view or self.get_view()
+        self.summary_label.config(text=view.summary)
+
+    def search_keyword(self):
+        return self.search_var.get().strip().lower()
+
+    def schedule_search(self):
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(SEARCH_DEBOUNCE_MS, self.search_table)
 
     def search_table(self):
-        keyword = self.search_var.get().lower()
-        data = self.filter_data()
-        if keyword:
-            data = data[data['produk'].str.lower().str.contains(keyword, na=False)]
-        self.update_table(data)
-        self.update_summary() 
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+            self._search_job = None
+        if self.data_handler.get_data() is None:
+            return
+        self.update_table(self.get_view(self.search_keyword()))
 
     def sort_table(self, col, reverse):
-        data = [(self.table.set(k, col), k) for k in self.table.get_children()]
-        try:
-            data.sort(key=lambda t: float(t[0]) if t[0].replace('.', '', 1).isdigit() else t[0], reverse=reverse)
-        except:
-            data.sort(reverse=reverse)
-        for index, (_, k) in enumerate(data):
-            self.table.move(k, '', index)
         self.table.heading(col, command=lambda: self.sort_table(col, not reverse))
+        data = self.table_view.data
+        if not isinstance(data, StoreView):
+            self.table_view.sort(col, reverse)
+            return
+        # Urutan dari SQLite dibentuk sekali di thread latar; setelah itu menggulir hanya membaca jendela
+        view = data.sorted(col, reverse)
+
+        def done(sorted_view):
+            if self.table_view.data is data:
+                self.table_view.show_sorted(sorted_view)
+
+        self.run_task('urut', lambda progress: view.prepare(), done,
+                      on_error=lambda e: messagebox.showerror("Error", f"Gagal mengurutkan tabel: {e}"))
 
     def load_data(self):
         file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
-        if file_path and self.data_handler.load_csv(file_path):
-            messagebox.showinfo("Sukses", "Data berhasil dimuat.")
-            data = self.data_handler.get_data()
-            if data is not None:
-                unique_products = sorted(data['produk'].dropna().unique().tolist())
-                self.product_filter['values'] = ["Semua"] + unique_products
-                self.product_filter.current(0)
-                self.update_table(data)
-
-                # Tambahkan ringkasan berdasarkan filter aktif
-                filtered = self.filter_data()
-                try:
-                    total_transaksi = len(filtered)
-                    total_unit = int(filtered['jumlah_terjual'].sum())
-                    total_pendapatan = int(filtered['pendapatan'].sum())
-                    top_produk = filtered.groupby('produk')['jumlah_terjual'].sum()
-
-                    if not top_produk.empty:
-                        sepatu_terlaris = top_produk.idxmax()
-                        jumlah_terlaris = top_produk.max()
-                    else:
-                        sepatu_terlaris = '-'
-                        jumlah_terlaris = 0
-
-                    self.summary_label.config(
-                        text=f"Transaksi: {total_transaksi} | Unit Terjual: {total_unit} | "
-                            f"Pendapatan: Rp {total_pendapatan:,} | "
-                            f"Sepatu Terlaris: {sepatu_terlaris} ({jumlah_terlaris} unit)"
-                    )
-                except Exception as e:
-                    self.summary_label.config(text=f"Ringkasan gagal dimuat: {e}")
-      
-
-
-    def filter_data(self):
-        start = pd.to_datetime(self.start_date.get_date())
-        end = pd.to_datetime(self.end_date.get_date())
-        data = self.data_handler.filter_by_date(start, end)
-        selected_product = self.product_filter.get()
-        if selected_product != "Semua":
-            data = data[data['produk'] == selected_product]
-        return data
+        if not file_path:
+            return
+        chunksize = None
+        if os.path.getsize(file_path) >= STREAM_THRESHOLD_BYTES:
+            chunksize = STREAM_CHUNKSIZE
+        # Dimuat ke handler baru supaya data lama tetap bisa dipakai sampai pemuatan selesai
+        handler = DataHandler(cache=self.cache)
+        follow = self.follow_var.get()
+
+        def job(progress):
+            if not handler.load_csv(file_path, chunksize=chunksize, progress=progress, follow=follow):
+                raise ValueError(handler.last_error)
+            return handler
+
+        self.run_task('muat', job, self.on_data_loaded,
+                      on_error=lambda e: messagebox.showerror("Error", f"Gagal memuat file: {e}"))
+
+    def load_folder(self):
+        folder = filedialog.askdirectory()
+        if not folder:
+            return
+        handler = DataHandler(cache=self.cache)
 
-    def analyze_sales(self):
-        data = self.filter_data()
-        if data.empty:
-            messagebox.showinfo("Info", "Tidak ada data pada rentang waktu tersebut.")
+        def job(progress):
+            if not handler.load_many(folder, progress=progress):
+                raise ValueError(handler.last_error)
+            return handler
+
+        self.run_task('muat', job, self.on_data_loaded,
+                      on_error=lambda e: messagebox.showerror("Error", f"Gagal memuat folder: {e}"))
+
+    def load_database(self):
+        """Buka database SQLite, atau muat CSV ke database di sebelahnya (untuk data melebihi RAM)."""
+        file_path = filedialog.askopenfilename(filetypes=[("Database atau CSV", "*.sqlite *.db *.csv")])
+        if not file_path:
+            return
+        csv_path = None
+        store_path = file_path
+        if file_path.lower().endswith('.csv'):
+            store_path = os.path.splitext(file_path)[0] + '.sqlite'
+            if not os.path.exists(store_path) or messagebox.askyesno(
+                    "Database", f"{store_path} sudah ada. Buat ulang dari CSV?"):
+                csv_path = file_path
+
+        def job(progress):
+            store = SalesStore(store_path)
+            if csv_path is not None and not store.load_csv(csv_path, progress=progress):
+                raise ValueError(store.last_error)
+            if store.get_data() is None:
+                raise ValueError(store.last_error or "Database kosong atau bukan database penjualan")
+            return store
+
+        self.run_task('muat', job, self.on_data_loaded,
+                      on_error=lambda e: messagebox.showerror("Error", f"Gagal memuat database: {e}"))
+
+    def toggle_follow(self):
+        if self.follow_var.get():
+            self.poll_source()
+        elif self._follow_job is not None:
+            self.root.after_cancel(self._follow_job)
+            self._follow_job = None
+
+    def poll_source(self):
+        """Mode pantau: baca baris yang baru ditambahkan ke CSV lalu jadwalkan cek berikutnya."""
+        self._follow_job = None
+        if not self.follow_var.get():
+            return
+        handler = self.data_handler
+        if handler.source is None:
+            self.follow_var.set(False)
+            messagebox.showinfo("Info", "Mode pantau hanya untuk data yang dimuat dari satu file CSV.")
+            return
+
+        def done(update):
+            if handler is self.data_handler and handler.append_rows(update):
+                self.clear_views()
+                self.product_filter['values'] = ["Semua"] + handler.products()
+                self.update_table(self.get_view(self.search_keyword()))
+            if self.follow_var.get():
+                self._follow_job = self.root.after(TAIL_POLL_MS, self.poll_source)
+
+        def failed(e):
+            self.follow_var.set(False)
+            messagebox.showerror("Error", f"Gagal membaca baris baru: {e}")
+
+        self.tasks.submit('pantau', lambda progress: handler.read_new_rows(), done, failed)
+
+    def on_data_loaded(self, handler):
+        # Analisis atas data lama tidak boleh menimpa tabel dan grafik data baru
+        self.tasks.cancel('analisis', notify=False)
+        self.data_handler = handler
+        self.clear_views()
+        if handler.skipped_files:
+            messagebox.showwarning("Peringatan", "File berikut dilewati:\n" + "\n".join(handler.skipped_files))
+        messagebox.showinfo("Sukses", "Data berhasil dimuat.")
+        if self.data_handler.get_data() is not None:
+            unique_products = self.data_handler.products()
+            self.product_filter['values'] = ["Semua"] + unique_products
+            self.product_filter.current(0)
+            self.update_table(self.get_view(all_rows=True))
+
+    def run_task(self, channel, func, on_done, on_error=None):
+        self.cancel_button.config(state=tk.NORMAL)
+        self.tasks.submit(channel, func, on_done, on_error)
+
+    def run_view_task(self, compute, render, all_rows=False, empty_message=None):
+        """Filter dan agregasi dijalankan di thread latar, gambar dibuat di thread Tk.
+
+        compute menerima Query untuk keadaan filter yang sama dengan tabel, sehingga
+        agregat hanya membaca kolom dan baris (kubus) yang dibutuhkan. Aksi analisis
+        baru menggantikan yang lama, dan hasil untuk data yang sudah diganti atau
+        ditambah (versi lain) dibuang, sehingga hasil filter usang tidak digambar.
+        """
+        handler, key = self.data_handler, self.view_key(all_rows=all_rows)
+
+        def job(progress):
+            view = self.build_view(handler, key)
+            if view.data.empty:
+                return view, None
+            return view, compute(self.view_query(handler, key))
+
+        def done(result):
+            if handler is not self.data_handler or key[-1] != handler.version:
+                return
+            view, value = result
+            if view.data.empty and empty_message:
+                messagebox.showinfo("Info", empty_message)
+                return
+            render(view, value)
+
+        self.run_task('analisis', job, done)
+
+    def show_task_progress(self, fraction):
+        if fraction is None:
+            self.progress.config(mode='indeterminate')
+            self.progress.step(5)
+        else:
+            self.progress.config(mode='determinate', value=fraction * 100)
+
+    def on_tasks_idle(self):
+        self.progress.config(mode='determinate', value=0)
+        self.cancel_button.config(state=tk.DISABLED)
+
+    def cancel_tasks(self):
+        # Mode pantau dihentikan lewat kotak centang "Pantau File", bukan tombol Batal
+        self.tasks.cancel(keep=('pantau',))
+
+    def refresh_status(self):
+        """Tampilkan catatan profil terakhir; profiler bisa diisi dari thread latar, jadi dibaca berkala."""
+        if profiler.sequence != self._status_sequence:
+            self._status_sequence = profiler.sequence
+            record = profiler.last()
+            if record is not None:
+                text = f"{record.nama}: {record.detik * 1000:.1f} ms"
+                if record.baris is not None:
+                    text += f" | {record.baris:,} baris"
+                if record.memori is not None:
+                    text += f" | memori {record.memori / 1024 ** 2:+.1f} MB"
+                self.status_label.config(text=text)
+        self.root.after(STATUS_POLL_MS, self.refresh_status)
+
+    def toggle_profiling(self):
+        enabled = self.profile_var.get()
+        profiler.configure(memory=enabled, cprofile=enabled)
+
+    def export_timings(self):
+        file_path = filedialog.asksaveasfilename(defaultextension=".csv",
+                                                 filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json")])
+        if not file_path:
             return
         try:
-            analyzer = SalesAnalyzer(data)
-            series = analyzer.total_sales_per_product()
-            self.fig = analyzer.draw_plot(series, 'bar', 'Jumlah Terjual per Produk', self.canvas_frame)
-            self.update_table(data)
+            written = profiler.export(file_path)
+            messagebox.showinfo("Sukses", "Catatan waktu disimpan:\n" + "\n".join(written))
         except Exception as e:
-            messagebox.showerror("Error", str(e))
+            messagebox.showerror("Error", f"Gagal menyimpan catatan waktu: {e}")
 
-    def analyze_income(self):
-        data = self.filter_data()
-        if data.empty:
-            messagebox.showinfo("Info", "Tidak ada data pada rentang waktu tersebut.")
-            return
+    def on_close(self):
+        self.tasks.shutdown()
+        self._panel_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def filter_args(self):
+        start = pd.to_datetime(self.start_date.get_date())
+        end = pd.to_datetime(self.end_date.get_date())
+        selected_product = self.product_filter.get()
+        product = None if selected_product == "Semua" else selected_product
+        return start, end, product
+
+    def view_key(self, keyword='', all_rows=False):
+        """Kunci keadaan filter; dibaca dari widget sehingga hanya boleh di thread Tk."""
+        key = (None, None, None) if all_rows else self.filter_args()
+        return key + (keyword, self.data_handler.version)
+
+    def clear_views(self):
+        """Buang view dan panel dashboard tersimpan; dipanggil saat data atau versinya berganti.
+
+        Setiap ViewState memegang data terfilter, jadi entri versi lama akan menahan
+        seluruh data set sebelumnya di memori.
+        """
+        with self._views_lock:
+            self._views.clear()
+        with self._panels_lock:
+            self._panels.clear()
+
+    @instrumented()
+    def build_view(self, handler, key):
+        """Data terfilter, kubusnya dan teks ringkasan untuk satu keadaan filter.
+
+        Hasil disimpan per (rentang tanggal, produk, kata kunci, versi data) sehingga
+        satu aksi hanya memfilter sekali. Aman dipanggil dari thread latar.
+        """
+        with self._views_lock:
+            view = self._views.get(key)
+        if view is not None:
+            return view
+        start, end, product, keyword, _ = key
+        query = self.view_query(handler, key)
+        data = query.collect()
+        if isinstance(data, StoreView):
+            # Urutan baris hasil filter produk dibentuk di sini, bukan saat tabel digulir
+            data.prepare()
+        cube = query.from_cube().collect()
+        if start is None and not keyword:
+            stats = handler.stats
+        else:
+            stats = query.summary(data, cube)
+        view = ViewState(data, cube, stats, self.summary_text(stats))
+        if handler is not self.data_handler or key[-1] != handler.version:
+            # Data sudah berganti selama view dihitung; jangan simpan entri usang
+            return view
+        with self._views_lock:
+            if len(self._views) >= self.VIEW_CACHE_SIZE:
+                self._views.pop(next(iter(self._views)))
+            self._views[key] = view
+        return view
+
+    @staticmethod
+    def view_query(handler, key):
+        start, end, product, keyword, _ = key
+        return handler.query().where(start, end, product, keyword)
+
+    def get_view(self, keyword='', all_rows=False):
+        return self.build_view(self.data_handler, self.view_key(keyword, all_rows))
+
+    @staticmethod
+    def summary_text(stats):
         try:
-            analyzer = SalesAnalyzer(data)
-            series = analyzer.daily_income()
+            total_transaksi = stats.count
+            total_unit = stats.total_units
+            total_pendapatan = int(stats.total_income)
+            sepatu_terlaris, jumlah_terlaris = stats.top_product()
+            if sepatu_terlaris is None:
+                sepatu_terlaris = '-'
+
+            return (f"Transaksi: {total_transaksi} | Unit Terjual: {total_unit} | "
+                    f"Pendapatan: Rp {total_pendapatan:,} | "
+                    f"Sepatu Terlaris: {sepatu_terlaris} ({jumlah_terlaris} unit)")
+        except Exception as e:
+            return f"Ringkasan gagal dimuat: {e}"
 
-            # Bersihkan frame lama
-            for widget in self.canvas_frame.winfo_children():
-                widget.destroy()
+    def analyze_sales(self):
+        def render(view, series):
+            analyzer = SalesAnalyzer(view.data, view.cube)
+            self.fig = analyzer.draw_plot(series, 'bar', 'Jumlah Terjual per Produk', self.chart)
+            self.update_table(view)
 
-            # Plot lebih menarik
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(series.index, series.values, marker='o', linestyle='-', linewidth=2, color='#007acc', alpha=0.85)
+        self.run_view_task(lambda query: query.aggregate('total_sales_per_product').collect(), render,
+                           empty_message="Tidak ada data pada rentang waktu tersebut.")
 
-            ax.set_title("📈 Pendapatan Harian", fontsize=14, fontweight='bold')
+    def analyze_income(self):
+        self.run_view_task(lambda query: query.aggregate('daily_income').collect(), self.render_income,
+                           empty_message="Tidak ada data pada rentang waktu tersebut.")
+
+    @instrumented()
+    def render_income(self, view, series):
+        ax, fresh = self.chart.axes('pendapatan_harian')
+        series, unit = level_of_detail(series, self.chart.max_points(ax))
+        marker = 'o' if len(series) <= LOD_MARKER_POINTS else None
+        self.chart.line(ax, 'line', series.index, series.values,
+                        marker=marker, linestyle='-', linewidth=2, color='#007acc', alpha=0.85)
+        ax.set_title(f"📈 Pendapatan {unit}", fontsize=14, fontweight='bold')
+        if fresh:
             ax.set_xlabel("Tanggal", fontsize=12)
             ax.set_ylabel("Pendapatan (Rp)", fontsize=12)
             ax.grid(True, linestyle='--', alpha=0.6)
             ax.tick_params(axis='x', rotation=45)
-
             # Format angka Y pakai koma
-            import matplotlib.ticker as mtick
-            ax.yaxis.set_major_formatter(mtick.FuncFormatter(lambda x, _: f'{int(x):,}'))
+            format_rupiah_axis(ax)
+        self.chart.render()
+        self.fig = self.chart.figure
 
-            fig.tight_layout()
-            self.fig = fig
-            canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-            self.update_table(data)
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self.update_table(view)
 
 
     def analyze_all(self):
@@ -390,91 +2728,126 @@ class MainAppGUI:
             messagebox.showwarning("Peringatan", "Data belum dimuat.")
             return
 
-        analyzer = SalesAnalyzer(data)
         selected = self.view_var.get()
+        key = self.view_key(all_rows=True)
+
+        def compute(query):
+            return key, self.dashboard_series(key, query, self.DASHBOARD_SERIES[selected])
+
+        self.run_view_task(compute, lambda view, result: self.render_all(selected, view, *result), all_rows=True)
+
+    def dashboard_series(self, key, query, names):
+        """Seri panel dashboard untuk satu keadaan filter.
+
+        Seri yang sudah pernah dihitung untuk kunci yang sama (termasuk versi data)
+        dipakai ulang; sisanya dihitung bersamaan di pool panel.
+        """
+        with self._panels_lock:
+            cached = dict(self._panels.get(key, {}))
+        futures = {name: self._panel_pool.submit(query.aggregate(name).collect)
+                   for name in names if name not in cached}
+        for name, future in futures.items():
+            cached[name] = future.result()
+        if query.handler is not self.data_handler or key[-1] != query.handler.version:
+            return {name: cached[name] for name in names}
+        with self._panels_lock:
+            if key not in self._panels and len(self._panels) >= self.VIEW_CACHE_SIZE:
+                self._panels.pop(next(iter(self._panels)))
+            self._panels.setdefault(key, {}).update(cached)
+        return {name: cached[name] for name in names}
+
+    @instrumented()
+    def render_all(self, selected, view, key, all_series):
+        layout = ('dashboard', selected)
+        if self.chart.show(layout, key):
+            # Panel ini sudah digambar untuk data dan filter yang sama
+            self.fig = self.chart.figure
+            self.update_table(view)
+            return
 
-        for widget in self.canvas_frame.winfo_children():
-            widget.destroy()
+        analyzer = SalesAnalyzer(view.data, view.cube)
 
         if selected == "Pie Pendapatan":
-            series = analyzer.income_per_product()
-            self.fig = analyzer.draw_plot(series, 'pie', 'Kontribusi Pendapatan', self.canvas_frame)
+            series = all_series['income_per_product']
+            self.fig = analyzer.draw_plot(series, 'pie', 'Kontribusi Pendapatan', self.chart, layout)
 
         elif selected == "Total Penjualan Bulanan":
-            series = analyzer.monthly_sales()
-            self.fig = analyzer.draw_plot(series, 'bar', 'Jumlah Terjual per Bulan', self.canvas_frame)
+            series = all_series['monthly_sales']
+            self.fig = analyzer.draw_plot(series, 'bar', 'Jumlah Terjual per Bulan', self.chart, layout)
 
         elif selected == "Pendapatan Bulanan":
-            series = analyzer.monthly_income()
-
-            # Bersihkan canvas
-            for widget in self.canvas_frame.winfo_children():
-                widget.destroy()
-
-            fig, ax = plt.subplots(figsize=(12, 6))
-            x = series.index.strftime('%b %Y')
+            series = all_series['monthly_income']
+            ax, fresh = self.chart.axes(layout)
+            labels = list(series.index.strftime('%b %Y'))
+            positions = np.arange(len(labels))
             y = series.values
 
-            ax.plot(x, y, marker='o', linestyle='-', linewidth=2, color='#2b83ba')
-            for i, val in enumerate(y):
-                ax.text(i, val, f'{int(val):,}', ha='center', va='bottom', fontsize=9)
-
-            ax.set_title("📅 Pendapatan per Bulan", fontsize=14, fontweight='bold')
-            ax.set_xlabel("Bulan", fontsize=12)
-            ax.set_ylabel("Pendapatan (Rp)", fontsize=12)
-            ax.grid(True, linestyle='--', alpha=0.6)
-            ax.tick_params(axis='x', rotation=30)
-
-            import matplotlib.ticker as mtick
-            ax.yaxis.set_major_formatter(mtick.FuncFormatter(lambda x, _: f'{int(x):,}'))
-
-            fig.tight_layout()
-            self.fig = fig
-            canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
+            self.chart.line(ax, 'line', positions, y, marker='o', linestyle='-', linewidth=2, color='#2b83ba')
+            self.chart.annotate(ax, 'line', positions, y, '{:,.0f}', fontsize=9)
+            ax.set_xticks(positions, labels, rotation=30)
+            if fresh:
+                ax.set_title("📅 Pendapatan per Bulan", fontsize=14, fontweight='bold')
+                ax.set_xlabel("Bulan", fontsize=12)
+                ax.set_ylabel("Pendapatan (Rp)", fontsize=12)
+                ax.grid(True, linestyle='--', alpha=0.6)
+                format_rupiah_axis(ax)
+            self.chart.render()
+            self.fig = self.chart.figure
 
         else:
-            fig, axs = plt.subplots(2, 2, figsize=(14, 8))
+            axs, fresh = self.chart.axes(layout, 2, 2)
 
-            monthly_sales = analyzer.monthly_sales()
-            axs[0, 0].bar(monthly_sales.index.strftime('%b %Y'), monthly_sales.values, color=sns.color_palette("pastel"))
+            monthly_sales = all_series['monthly_sales']
+            self.chart.bars(axs[0, 0], 'monthly_sales', list(monthly_sales.index.strftime('%b %Y')),
+                            monthly_sales.values, rotation=45, color=pastel_palette())
             axs[0, 0].set_title("Jumlah Terjual per Bulan")
-            axs[0, 0].tick_params(axis='x', labelrotation=45)
 
-            monthly_income = analyzer.monthly_income()
-            axs[0, 1].plot(monthly_income.index.strftime('%b %Y'), monthly_income.values, marker='o', color='tab:blue')
+            monthly_income = all_series['monthly_income']
+            labels = list(monthly_income.index.strftime('%b %Y'))
+            positions = np.arange(len(labels))
+            self.chart.line(axs[0, 1], 'monthly_income', positions, monthly_income.values, marker='o', color='tab:blue')
+            axs[0, 1].set_xticks(positions, labels, rotation=45)
             axs[0, 1].set_title("Pendapatan per Bulan")
-            axs[0, 1].tick_params(axis='x', labelrotation=45)
 
-            income_data = analyzer.income_per_product()
+            income_data = all_series['income_per_product']
+            axs[1, 0].clear()
             if income_data.shape[0] > 1:
-                axs[1, 0].pie(income_data, labels=income_data.index, autopct='%1.1f%%', colors=sns.color_palette("pastel"))
+                axs[1, 0].pie(income_data, labels=income_data.index, autopct='%1.1f%%', colors=pastel_palette())
                 axs[1, 0].set_title("Kontribusi Pendapatan")
                 axs[1, 0].set_ylabel('')
             else:
                 axs[1, 0].text(0.5, 0.5, 'Data tidak cukup untuk pie chart', ha='center')
 
-            axs[1, 1].axis('off')
+            if fresh:
+                axs[1, 1].axis('off')
 
-            fig.tight_layout(pad=3.0)
-            self.fig = fig
-            canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self.chart.render(pad=3.0)
+            self.fig = self.chart.figure
 
-        self.update_table(data)
+        self.chart.signature = key
+        self.update_table(view)
 
 
     def save_summary(self):
         data = self.data_handler.get_data()
         if data is not None and not data.empty:
-            analyzer = SalesAnalyzer(data)
+            analyzer = SalesAnalyzer(data, self.data_handler.cube.frame, self.data_handler.stats)
             file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
             if file_path:
-                analyzer.export_summary(file_path)
-                messagebox.showinfo("Sukses", f"Statistik disimpan ke {file_path}")
+                self.run_task('simpan', lambda progress: analyzer.export_summary(file_path, extended=True),
+                              lambda _: messagebox.showinfo("Sukses", f"Statistik disimpan ke {file_path}"))
+
+    def save_bulk_reports(self):
+        data = self.data_handler.get_data()
+        if data is None or data.empty:
+            return
+        folder = filedialog.askdirectory()
+        if folder:
+            report = BulkReport(self.data_handler)
+            # Kanal sendiri: menyimpan ringkasan tidak boleh membatalkan laporan massal (dan sebaliknya)
+            self.run_task('laporan', lambda progress: report.run(folder, progress=progress),
+                          lambda outputs: messagebox.showinfo("Sukses", f"{len(outputs)} file laporan disimpan ke {folder}"),
+                          on_error=lambda e: messagebox.showerror("Error", f"Gagal membuat laporan massal: {e}"))
 
     def save_graph(self):
         if self.fig:
@@ -482,55 +2855,63 @@ class MainAppGUI:
             if file_path:
                 self.fig.savefig(file_path)
                 messagebox.showinfo("Sukses", f"Grafik disimpan ke {file_path}")
-    def tampilkan_bar_chart(self):
-        data = self.filter_data()
-        if data.empty:
+    def chart_query(self):
+        """Query untuk filter saat ini, atau None (dengan pesan) bila tidak ada baris."""
+        query = self.view_query(self.data_handler, self.view_key())
+        if not query.count():
             messagebox.showinfo("Info", "Tidak ada data untuk ditampilkan.")
+            return None
+        return query
+
+    def tampilkan_bar_chart(self):
+        query = self.chart_query()
+        if query is None:
             return
-        series = data.groupby('produk')['jumlah_terjual'].sum().sort_values()
+        series = query.aggregate('total_sales_per_product').collect().sort_values()
         self.draw_custom_chart(series, 'barh', 'Total Penjualan per Produk')
 
     def tampilkan_line_chart(self):
-            data = self.filter_data()
-            if data.empty:
-                messagebox.showinfo("Info", "Tidak ada data untuk ditampilkan.")
+            query = self.chart_query()
+            if query is None:
                 return
-            series = data.groupby('tanggal')['pendapatan'].sum()
+            series = query.aggregate('daily_income').collect()
             self.draw_custom_chart(series, 'line', 'Pendapatan Harian')
 
     def tampilkan_pie_chart(self):
-            data = self.filter_data()
-            if data.empty:
-                messagebox.showinfo("Info", "Tidak ada data untuk ditampilkan.")
+            query = self.chart_query()
+            if query is None:
                 return
-            series = data.groupby('produk')['jumlah_terjual'].sum()
+            series = query.aggregate('total_sales_per_product').collect()
             self.draw_custom_chart(series, 'pie', 'Proporsi Penjualan per Produk')
 
+    @instrumented()
     def draw_custom_chart(self, series, kind, title):
-            for widget in self.canvas_frame.winfo_children():
-                widget.destroy()
-            fig, ax = plt.subplots(figsize=(10, 5))
+            ax, fresh = self.chart.axes(('custom', kind))
             if kind == 'pie':
+                ax.clear()
                 if series.shape[0] > 1:
-                    ax.pie(series.values, labels=series.index, autopct='%1.1f%%', startangle=140, colors=sns.color_palette("pastel"))
+                    ax.pie(series.values, labels=series.index, autopct='%1.1f%%', startangle=140, colors=pastel_palette())
                     ax.set_ylabel('')
                 else:
                     ax.text(0.5, 0.5, 'Data tidak cukup untuk pie chart', ha='center')
             elif kind == 'line':
-                ax.plot(series.index, series.values, marker='o', linestyle='-', color='green')
+                series, unit = level_of_detail(series, self.chart.max_points(ax))
+                if unit != 'Harian':
+                    title = f"{title} ({unit})"
+                marker = 'o' if len(series) <= LOD_MARKER_POINTS else None
+                self.chart.line(ax, 'line', series.index, series.values, marker=marker, linestyle='-', color='green')
                 ax.set_xlabel(series.index.name or "")
                 ax.set_ylabel("Nilai")
             elif kind == 'barh':
+                ax.clear()
                 ax.barh(series.index, series.values, color='skyblue')
                 ax.set_xlabel("Jumlah")
             else:
+                ax.clear()
                 series.plot(kind=kind, ax=ax)
             ax.set_title(title)
-            fig.tight_layout()
-            canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            self.fig = fig
+            self.chart.render()
+            self.fig = self.chart.figure
 
     def tombol_visualisasi(self):
             frame = ttk.Frame(self.canvas_tab)
@@ -539,7 +2920,251 @@ class MainAppGUI:
             ttk.Button(frame, text="📈 Line Chart", command=self.tampilkan_line_chart).pack(side=tk.LEFT, padx=5)
             ttk.Button(frame, text="🥧 Pie Chart", command=self.tampilkan_pie_chart).pack(side=tk.LEFT, padx=5)
 
-if __name__ == "__main__":
+BulkItem = namedtuple('BulkItem', ['label', 'stem', 'stats', 'charts'])
+
+# ChartSurface milik proses pekerja laporan massal, dipakai ulang untuk semua item
+_bulk_surface = None
+
+
+def safe_filename(name):
+    return re.sub(r'[^\w.-]+', '_', str(name)).strip('_.') or 'item'
+
+
+def init_bulk_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+    apply_theme()
+
+
+def render_bulk_item(item):
+    """Tulis ringkasan CSV dan grafik satu item laporan massal; dijalankan di proses pekerja."""
+    global _bulk_surface
+    if _bulk_surface is None and item.charts:
+        _bulk_surface = ChartSurface()
+    analyzer = SalesAnalyzer(None)
+    os.makedirs(os.path.dirname(item.stem), exist_ok=True)
+    summary_path = f"{item.stem}_ringkasan.csv"
+    SalesAnalyzer.summary_frame(item.stats).to_csv(summary_path, index=False)
+    outputs = [summary_path]
+    for suffix, series, kind, title in item.charts:
+        chart_path = f"{item.stem}_{suffix}.png"
+        analyzer.draw_plot(series, kind, title, _bulk_surface).savefig(chart_path)
+        outputs.append(chart_path)
+    return outputs
+
+
+class BulkReport:
+    """Laporan massal: ringkasan CSV serta grafik batang, garis dan pie untuk setiap produk dan bulan.
+
+    Agregat dihitung sekali dari kubus (dan statistik per kelompok dari satu groupby),
+    lalu setiap item hanya membawa potongan kecilnya ke proses pekerja berbackend Agg.
+    Item ditulis ke subfolder produk/ dan bulan/ di folder keluaran.
+    """
+    def __init__(self, handler, charts=True):
+        self.handler = handler
+        self.charts = charts
+
+    def group_stats(self, by, keys, cube):
+        data = self.handler.get_data()
+        if isinstance(data, pd.DataFrame):
+            return SummaryStats.grouped(data, by, cube)
+        # SalesStore: satu kueri SQL berindeks per item, tanpa memuat transaksi
+        if by == 'produk':
+            return {key: self.handler.query().where(product=key).summary() for key in keys}
+        return {key: self.handler.query().where(key.start_time, key.end_time).summary() for key in keys}
+
+    def items(self, output_dir):
+        cube = self.handler.cube.frame
+        cube = cube.assign(bulan=cube['tanggal'].dt.to_period('M'))
+        monthly = cube.groupby(['bulan', 'produk'], observed=True)[SalesCube.VALUES].sum()
+        daily_total = cube.groupby('tanggal')['pendapatan'].sum()
+        products = self.handler.products()
+        months = list(monthly.index.get_level_values('bulan').unique())
+        product_stats = self.group_stats('produk', products, cube)
+        month_stats = self.group_stats('bulan', months, cube)
+        used = set()
+
+        def stem(folder, name):
+            base = path = os.path.join(output_dir, folder, safe_filename(name))
+            for number in itertools.count(2):
+                if path.lower() not in used:
+                    break
+                path = f"{base}_{number}"
+            used.add(path.lower())
+            return path
+
+        items = []
+        per_product = monthly.groupby(level='produk', observed=True)
+        for product, part in cube.groupby('produk', observed=True):
+            totals = per_product.get_group(product).droplevel('produk')
+            charts = [
+                ('batang', totals['jumlah_terjual'], 'bar', f'Jumlah Terjual per Bulan - {product}'),
+                ('garis', part.set_index('tanggal')['pendapatan'], 'line', f'Pendapatan Harian - {product}'),
+                ('pie', totals['pendapatan'].rename(index=str), 'pie', f'Kontribusi Pendapatan per Bulan - {product}'),
+            ] if self.charts else []
+            items.append(BulkItem(product, stem('produk', product), product_stats[product], charts))
+        daily_months = daily_total.groupby(daily_total.index.to_period('M'))
+        for month, totals in monthly.groupby(level='bulan'):
+            totals = totals.droplevel('bulan')
+            label = str(month)
+            charts = [
+                ('batang', totals['jumlah_terjual'], 'bar', f'Jumlah Terjual per Produk - {label}'),
+                ('garis', daily_months.get_group(month), 'line', f'Pendapatan Harian - {label}'),
+                ('pie', totals['pendapatan'], 'pie', f'Kontribusi Pendapatan per Produk - {label}'),
+            ] if self.charts else []
+            items.append(BulkItem(label, stem('bulan', label), month_stats[month], charts))
+        return items
+
+    @instrumented('BulkReport.run')
+    def run(self, output_dir, workers=None, progress=None):
+        """Tulis semua item; workers=1 menggambar di proses ini. Mengembalikan daftar file."""
+        items = self.items(output_dir)
+        outputs = []
+        if workers == 1:
+            for done, item in enumerate(items, 1):
+                outputs.extend(render_bulk_item(item))
+                if progress is not None:
+                    progress(done / len(items))
+            return outputs
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_bulk_worker) as executor:
+            futures = [executor.submit(render_bulk_item, item) for item in items]
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    future.result()
+                    if progress is not None:
+                        progress(done / len(items))
+            except TaskCancelled:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        # Urutan file mengikuti urutan item, bukan urutan selesai
+        for future in futures:
+            outputs.extend(future.result())
+        return outputs
+
+
+BatchResult = namedtuple('BatchResult', ['path', 'ok', 'outputs', 'error'])
+
+
+class ReportEngine:
+    """Menjalankan DataHandler dan SalesAnalyzer tanpa Tkinter untuk banyak file CSV.
+
+    Setiap file menghasilkan ringkasan export_summary dan grafik PNG (backend Agg)
+    di folder keluaran, dengan nama berawalan nama file sumber. Dengan bulk, laporan
+    per produk dan per bulan (BulkReport) ditulis ke folder <nama>_massal.
+    """
+    # nama grafik -> (metode SalesAnalyzer, jenis grafik, judul)
+    CHARTS = {
+        'produk_terjual': ('total_sales_per_product', 'bar', 'Jumlah Terjual per Produk'),
+        'pendapatan_produk': ('income_per_product', 'pie', 'Kontribusi Pendapatan'),
+        'penjualan_bulanan': ('monthly_sales', 'bar', 'Jumlah Terjual per Bulan'),
+        'pendapatan_harian': ('daily_income', 'line', 'Pendapatan Harian'),
+    }
+
+    def __init__(self, output_dir, charts=True, chunksize=None, cache=None, extended=False,
+                 bulk=False, workers=None):
+        self.output_dir = output_dir
+        self.charts = charts
+        self.chunksize = chunksize
+        self.cache = cache
+        self.extended = extended
+        self.bulk = bulk
+        self.workers = workers
+
+    def _prepare(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        if self.charts:
+            import matplotlib
+            matplotlib.use('Agg')
+            apply_theme()
+
+    def run(self, paths):
+        self._prepare()
+        return [self.run_file(path) for path in paths]
+
+    def run_combined(self, paths, name='gabungan', workers=None):
+        """Semua file dimuat paralel sebagai satu data set dan dilaporkan sekali."""
+        self._prepare()
+        handler = DataHandler(cache=self.cache)
+        if not handler.load_many(paths, workers=workers):
+            return BatchResult(name, False, [], handler.last_error)
+        return self.write_reports(handler, name)
+
+    def run_file(self, path):
+        handler = DataHandler(cache=self.cache)
+        if not handler.load_csv(path, chunksize=self.chunksize):
+            return BatchResult(path, False, [], handler.last_error)
+        return self.write_reports(handler, os.path.splitext(os.path.basename(path))[0], path)
+
+    def write_reports(self, handler, stem, path=None):
+        path = path or stem
+        if handler.get_data().empty:
+            return BatchResult(path, False, [], "Tidak ada data valid")
+        try:
+            analyzer = SalesAnalyzer(handler.get_data(), handler.cube.frame, handler.stats)
+            summary_path = os.path.join(self.output_dir, f"{stem}_ringkasan.csv")
+            analyzer.export_summary(summary_path, extended=self.extended)
+            outputs = [summary_path]
+            if self.charts:
+                surface = ChartSurface()
+                for name, (method, kind, title) in self.CHARTS.items():
+                    chart_path = os.path.join(self.output_dir, f"{stem}_{name}.png")
+                    analyzer.draw_plot(getattr(analyzer, method)(), kind, title, surface).savefig(chart_path)
+                    outputs.append(chart_path)
+            if self.bulk:
+                outputs += BulkReport(handler, self.charts).run(os.path.join(self.output_dir, f"{stem}_massal"),
+                                                   workers=self.workers)
+            logging.info(f"{path}: {len(outputs)} file laporan ditulis")
+            return BatchResult(path, True, outputs, None)
+        except Exception as e:
+            logging.error(f"Gagal membuat laporan {path}: {e}")
+            return BatchResult(path, False, [], str(e))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aplikasi Analisis Penjualan")
+    parser.add_argument('csv', nargs='*', help="file CSV (boleh pola glob); bila diisi berjalan tanpa GUI")
+    parser.add_argument('-o', '--output', default='laporan', help="folder keluaran mode batch")
+    parser.add_argument('--tanpa-grafik', action='store_true', help="hanya tulis ringkasan CSV")
+    parser.add_argument('--tanpa-cache', action='store_true', help="jangan pakai cache Feather")
+    parser.add_argument('--chunksize', type=int, help="muat CSV per potongan sebanyak N baris")
+    parser.add_argument('--gabung', action='store_true',
+                        help="muat semua file (atau folder) paralel sebagai satu data set")
+    parser.add_argument('--pekerja', type=int, help="jumlah proses pekerja untuk --gabung dan --massal")
+    parser.add_argument('--massal', action='store_true',
+                        help="tambahkan ringkasan dan grafik untuk setiap produk dan setiap bulan")
+    parser.add_argument('--lengkap', action='store_true',
+                        help="ringkasan dengan minimum, maksimum, median dan persentil pendapatan")
+    parser.add_argument('--profil', metavar='FILE',
+                        help="rekam waktu, memori dan cProfile lalu simpan ke FILE (.csv/.json)")
+    args = parser.parse_args(argv)
+    if args.profil:
+        profiler.configure(memory=True, cprofile=True)
+
+    if args.csv:
+        engine = ReportEngine(args.output, charts=not args.tanpa_grafik, chunksize=args.chunksize,
+                              cache=None if args.tanpa_cache else DataCache(), extended=args.lengkap,
+                              bulk=args.massal, workers=args.pekerja)
+        results = [BatchResult(pattern, False, [], "Tidak ada file yang cocok")
+                   for pattern in args.csv if not csv_paths(pattern)]
+        paths = csv_paths(args.csv)
+        if args.gabung and paths:
+            results.append(engine.run_combined(paths, workers=args.pekerja))
+        elif paths:
+            results += engine.run(paths)
+        for result in results:
+            if not result.ok:
+                print(f"GAGAL {result.path}: {result.error}", file=sys.stderr)
+        if args.profil:
+            profiler.export(args.profil)
+        return 0 if all(result.ok for result in results) else 1
+
+    load_gui_modules()
+    apply_theme()
     root = tk.Tk()
-    app = MainAppGUI(root)
+    MainAppGUI(root)
     root.mainloop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
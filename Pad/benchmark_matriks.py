@@ -0,0 +1,85 @@
+# Benchmark perkalian matriks: kali_naif vs kali_blok vs NumPy untuk beberapa ukuran
+#
+# Contoh:
+#   python benchmark_matriks.py
+#   python benchmark_matriks.py --ukuran 8 32 128 --ulang 5 --batch 10000
+#
+# Dari tabel terlihat titik silang (ukuran saat cara yang lebih "berat" mulai menang),
+# yang menjadi dasar AMBANG_BLOK dan AMBANG_NUMPY di matriks.py.
+import argparse
+import random
+import time
+
+import matriks
+
+
+def waktu(func, ulang):
+    """Waktu terbaik (detik) dari beberapa ulangan."""
+    terbaik = None
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        func()
+        lama = time.perf_counter() - mulai
+        terbaik = lama if terbaik is None else min(terbaik, lama)
+    return terbaik
+
+
+def matriks_acak(n, rng):
+    return [[rng.random() for _ in range(n)] for _ in range(n)]
+
+
+def titik_silang(hasil, lambat, cepat):
+    """Ukuran terkecil saat cara cepat sudah lebih cepat dari cara lambat."""
+    for n, baris in hasil:
+        if baris.get(cepat) is not None and baris.get(lambat) is not None and baris[cepat] < baris[lambat]:
+            return n
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark perkalian matriks")
+    parser.add_argument('--ukuran', type=int, nargs='+', default=[2, 4, 8, 16, 32, 64, 128, 256],
+                        help="sisi matriks persegi yang diukur")
+    parser.add_argument('--ulang', type=int, default=3, help="ulangi tiap pengukuran dan ambil waktu terbaik")
+    parser.add_argument('--batas-naif', type=int, default=128, help="lewati kali_naif di atas ukuran ini")
+    parser.add_argument('--batch', type=int, default=1000, help="jumlah matriks 4x4 untuk uji batch")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    cara = {'naif': matriks.kali_naif, 'blok': matriks.kali_blok}
+    if matriks.np is not None:
+        cara['numpy'] = lambda A, B: matriks.kali_numpy(A, B).tolist()
+    cara['otomatis'] = matriks.kali
+
+    hasil = []
+    print(f"{'n':>5}" + ''.join(f"{nama:>12}" for nama in cara))
+    for n in args.ukuran:
+        A, B = matriks_acak(n, rng), matriks_acak(n, rng)
+        baris = {}
+        for nama, func in cara.items():
+            if nama == 'naif' and n > args.batas_naif:
+                baris[nama] = None
+                continue
+            baris[nama] = waktu(lambda: func(A, B), args.ulang)
+        hasil.append((n, baris))
+        print(f"{n:>5}" + ''.join(f"{'-':>12}" if t is None else f"{t * 1000:>10.3f}ms" for t in baris.values()))
+
+    print()
+    print("Titik silang naif -> blok :", titik_silang(hasil, 'naif', 'blok'))
+    if matriks.np is not None:
+        print("Titik silang naif -> numpy:", titik_silang(hasil, 'naif', 'numpy'))
+        print("Titik silang blok -> numpy:", titik_silang(hasil, 'blok', 'numpy'))
+
+        # Banyak matriks kecil: satu np.matmul untuk seluruh tumpukan vs loop per matriks
+        As = [matriks_acak(4, rng) for _ in range(args.batch)]
+        Bs = [matriks_acak(4, rng) for _ in range(args.batch)]
+        arr_A, arr_B = matriks.np.array(As), matriks.np.array(Bs)
+        loop = waktu(lambda: [matriks.kali_naif(A, B) for A, B in zip(As, Bs)], args.ulang)
+        batch = waktu(lambda: matriks.kali_batch(arr_A, arr_B), args.ulang)
+        print()
+        print(f"{args.batch} matriks 4x4: loop kali_naif {loop * 1000:.3f}ms, "
+              f"kali_batch {batch * 1000:.3f}ms ({loop / batch:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+# Benchmark SPL: selesaikan() untuk satu tumpukan vs loop per sistem
+#
+# Contoh:
+#   python benchmark_spl.py
+#   python benchmark_spl.py --jumlah 1000 100000 --ukuran 2 3 8 --ulang 5
+#
+# Setiap baris membandingkan:
+#   cramer - loop Python dengan determinan seperti Nomer_Dua (hanya 2x2)
+#   loop   - np.linalg.solve satu per satu seperti Nomer_DuaB
+#   stack  - np.linalg.solve untuk seluruh tumpukan (tanpa deteksi singular)
+#   spl    - spl.selesaikan (dengan bilangan kondisi per sistem)
+import argparse
+import time
+
+import numpy as np
+
+import spl
+
+
+def waktu(func, ulang):
+    """Waktu terbaik (detik) dari beberapa ulangan."""
+    terbaik = None
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        func()
+        lama = time.perf_counter() - mulai
+        terbaik = lama if terbaik is None else min(terbaik, lama)
+    return terbaik
+
+
+def cramer(A, b):
+    """Aturan Cramer seperti Nomer_Dua, satu sistem 2x2 per iterasi."""
+    hasil = []
+    for (baris1, baris2), (c1, c2) in zip(A, b):
+        a1, b1 = baris1
+        a2, b2 = baris2
+        det = a1 * b2 - a2 * b1
+        hasil.append(((c1 * b2 - c2 * b1) / det, (a1 * c2 - a2 * c1) / det))
+    return hasil
+
+
+def loop(A, b):
+    return [np.linalg.solve(a, c) for a, c in zip(A, b)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark penyelesaian banyak SPL")
+    parser.add_argument('--jumlah', type=int, nargs='+', default=[100, 1000, 10000, 100000],
+                        help="jumlah sistem dalam satu tumpukan")
+    parser.add_argument('--ukuran', type=int, nargs='+', default=[2, 3, 5], help="ukuran n sistem n x n")
+    parser.add_argument('--ulang', type=int, default=3, help="ulangi tiap pengukuran dan ambil waktu terbaik")
+    parser.add_argument('--batas-loop', type=int, default=100000, help="lewati loop di atas jumlah ini")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'n':>3}{'N':>9}{'cramer':>12}{'loop':>12}{'stack':>12}{'spl':>12}{'loop/spl':>10}")
+    for n in args.ukuran:
+        for jumlah in args.jumlah:
+            A = rng.normal(size=(jumlah, n, n))
+            b = rng.normal(size=(jumlah, n))
+            waktu_loop = waktu(lambda: loop(A, b), args.ulang) if jumlah <= args.batas_loop else None
+            baris = {
+                'cramer': waktu(lambda: cramer(A.tolist(), b.tolist()), args.ulang) if n == 2 else None,
+                'loop': waktu_loop,
+                'stack': waktu(lambda: np.linalg.solve(A, b[:, :, None]), args.ulang),
+                'spl': waktu(lambda: spl.selesaikan(A, b), args.ulang),
+            }
+            rasio = f"{waktu_loop / baris['spl']:>9.0f}x" if waktu_loop else f"{'-':>10}"
+            print(f"{n:>3}{jumlah:>9}" + ''.join(
+                f"{'-':>12}" if t is None else f"{t * 1000:>10.2f}ms" for t in baris.values()) + rasio)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# Perkalian matriks untuk ukuran sembarang (perumuman Nomer_Satu dan Nomer_SatuB)
+#
+# Tiga cara perkalian:
+#   kali_naif  - triple nested loop seperti Nomer_Satu, untuk list of list
+#   kali_blok  - loop per blok (cache blocking) dengan baris array('d'), tanpa NumPy
+#   kali_numpy - np.matmul, juga untuk tumpukan matriks (batch) sekaligus
+# kali() memilih cara tercepat menurut ukuran; ambang diambil dari benchmark_matriks.py.
+from array import array
+
+try:
+    import numpy as np  # NumPy opsional, tanpa NumPy dipakai kali_naif / kali_blok
+except ImportError:
+    np = None
+
+# Ukuran sisi blok untuk kali_blok
+BLOK = 64
+# Di bawah n*m*p ini loop biasa lebih cepat daripada kali_blok (biaya menyiapkan array);
+# pada benchmark kali_blok mulai menang di sekitar n = 32
+AMBANG_BLOK = 32 ** 3
+# Di bawah n*m*p ini list -> ndarray lebih mahal daripada menghitung langsung (sekitar n = 4)
+AMBANG_NUMPY = 4 ** 3
+
+
+def ukuran(A):
+    """(baris, kolom) matriks list of list; setiap baris harus sama panjang."""
+    baris = len(A)
+    kolom = len(A[0]) if baris else 0
+    for row in A:
+        if len(row) != kolom:
+            raise ValueError("Panjang baris matriks tidak sama")
+    return baris, kolom
+
+
+def _cek_ukuran(A, B):
+    n, m = ukuran(A)
+    m2, p = ukuran(B)
+    if m != m2:
+        raise ValueError(f"Ukuran tidak cocok untuk perkalian: {n}x{m} dan {m2}x{p}")
+    return n, m, p
+
+
+def kali_naif(A, B):
+    """Perkalian A x B dengan triple nested loop (seperti Nomer_Satu, untuk ukuran apa pun)."""
+    n, m, p = _cek_ukuran(A, B)
+    C = [[0] * p for _ in range(n)]
+    for i in range(n):              # untuk setiap baris di A
+        for j in range(p):          # untuk setiap kolom di B
+            for k in range(m):      # untuk setiap elemen dalam baris dan kolom
+                C[i][j] += A[i][k] * B[k][j]
+    return C
+
+
+def kali_blok(A, B, blok=BLOK):
+    """Perkalian A x B per blok blok x blok dengan baris array('d'); hasil berupa float.
+
+    Urutan loop i-k-j memakai satu baris B sekaligus (bukan satu kolom), dan blok
+    membatasi potongan B yang sedang dipakai agar tetap di cache.
+    """
+    n, m, p = _cek_ukuran(A, B)
+    a = [array('d', row) for row in A]
+    b = [array('d', row) for row in B]
+    C = [array('d', bytes(8 * p)) for _ in range(n)]
+    for kk in range(0, m, blok):
+        k_akhir = min(kk + blok, m)
+        for jj in range(0, p, blok):
+            j_akhir = min(jj + blok, p)
+            # Potongan baris B untuk blok ini, dipakai ulang oleh semua baris A
+            b_blok = [b[k][jj:j_akhir] for k in range(kk, k_akhir)]
+            for i in range(n):
+                ai = a[i]
+                acc = C[i][jj:j_akhir].tolist()
+                for k, bk in enumerate(b_blok, kk):
+                    aik = ai[k]
+                    if aik:
+                        acc = [c + aik * x for c, x in zip(acc, bk)]
+                C[i][jj:j_akhir] = array('d', acc)
+    return [row.tolist() for row in C]
+
+
+def kali_numpy(A, B):
+    """np.matmul; A dan B boleh berupa tumpukan matriks (..., n, m) x (..., m, p)."""
+    if np is None:
+        raise ImportError("kali_numpy membutuhkan NumPy")
+    return np.matmul(np.asarray(A), np.asarray(B))
+
+
+def kali(A, B):
+    """Perkalian A x B dengan cara yang dipilih otomatis menurut ukuran.
+
+    ndarray (atau tumpukan matriks) langsung memakai np.matmul. Untuk list of list,
+    NumPy dipakai bila tersedia dan ukurannya di atas AMBANG_NUMPY, selain itu
+    kali_naif untuk matriks kecil dan kali_blok untuk yang besar. Hasil mengikuti
+    jenis masukan: ndarray untuk ndarray, list of list untuk list.
+    """
+    if np is not None and (isinstance(A, np.ndarray) or isinstance(B, np.ndarray)):
+        return kali_numpy(A, B)
+    n, m, p = _cek_ukuran(A, B)
+    if np is not None and n * m * p >= AMBANG_NUMPY:
+        return kali_numpy(A, B).tolist()
+    if n * m * p < AMBANG_BLOK:
+        return kali_naif(A, B)
+    return kali_blok(A, B)
+
+
+def kali_batch(As, Bs):
+    """Perkalian setiap pasangan matriks dalam dua tumpukan berisi matriks yang sama ukurannya.
+
+    Dengan NumPy seluruh tumpukan dihitung dalam satu np.matmul; tanpa NumPy setiap
+    pasangan dihitung dengan kali(). Bs boleh satu matriks yang dipakai untuk semua A.
+    """
+    if np is not None:
+        hasil = np.matmul(np.asarray(As), np.asarray(Bs))
+        return hasil if isinstance(As, np.ndarray) else hasil.tolist()
+    if Bs and not isinstance(Bs[0][0], (list, tuple, array)):
+        Bs = [Bs] * len(As)
+    if len(As) != len(Bs):
+        raise ValueError("Jumlah matriks dalam tumpukan tidak sama")
+    return [kali(A, B) for A, B in zip(As, Bs)]
+
+
+if __name__ == '__main__':
+    A = [[1, 2],
+         [3, 4]]
+    B = [[5, 6],
+         [7, 8]]
+    print("Hasil perkalian:")
+    for row in kali(A, B):
+        print(row)
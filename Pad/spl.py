@@ -0,0 +1,125 @@
+# Penyelesaian banyak sistem persamaan linear (SPL) sekaligus
+# (perumuman Nomer_Dua dan Nomer_DuaB)
+#
+# selesaikan(A, b) menerima tumpukan N sistem berukuran n x n dan menyelesaikannya
+# dalam satu panggilan tervektorisasi:
+#   n = 2 dan n = 3 - rumus tertutup (aturan Cramer / adjoin seperti Nomer_Dua)
+#   n lainnya       - np.linalg.inv untuk seluruh tumpukan (lebih mahal daripada
+#                     np.linalg.solve, tetapi memberi bilangan kondisi per sistem)
+# Sistem singular atau berkondisi buruk ditandai per elemen, tidak menggagalkan
+# seluruh tumpukan. Solusi sistem singular diisi NaN.
+from collections import namedtuple
+
+import numpy as np
+
+# Bilangan kondisi di atas ini dianggap berkondisi buruk (solusi kehilangan banyak digit)
+AMBANG_KONDISI = 1e12
+# Bilangan kondisi di atas ini (sekitar 1 / epsilon mesin) dianggap singular
+AMBANG_SINGULAR = 1 / np.finfo(float).eps
+
+HasilSPL = namedtuple('HasilSPL', ['x', 'kondisi', 'singular', 'buruk'])
+
+
+def _norma_1(M):
+    """Norma-1 (jumlah mutlak kolom terbesar) setiap matriks dalam tumpukan."""
+    return np.abs(M).sum(axis=-2).max(axis=-1)
+
+
+def _invers_2x2(A):
+    a, b = A[:, 0, 0], A[:, 0, 1]
+    c, d = A[:, 1, 0], A[:, 1, 1]
+    det = a * d - b * c
+    adj = np.empty_like(A)
+    adj[:, 0, 0], adj[:, 0, 1] = d, -b
+    adj[:, 1, 0], adj[:, 1, 1] = -c, a
+    return adj, det
+
+
+def _invers_3x3(A):
+    r0, r1, r2 = A[:, 0], A[:, 1], A[:, 2]
+    # Kolom adjoin adalah hasil kali silang baris-baris A
+    adj = np.stack([np.cross(r1, r2), np.cross(r2, r0), np.cross(r0, r1)], axis=-1)
+    det = np.einsum('ij,ij->i', r0, adj[:, :, 0])
+    return adj, det
+
+
+def _tertutup(A, b, invers):
+    """Invers dari rumus adjoin / determinan, lalu x = invers @ b."""
+    adj, det = invers(A)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv = adj / det[:, None, None]
+        kondisi = _norma_1(A) * _norma_1(inv)
+        x = inv @ b
+    kondisi[(det == 0) | ~np.isfinite(kondisi)] = np.inf
+    return x, kondisi
+
+
+def _umum(A, b):
+    try:
+        inv = np.linalg.inv(A)
+    except np.linalg.LinAlgError:
+        # np.linalg.inv menolak seluruh tumpukan bila ada satu sistem tepat singular;
+        # sisihkan sistem itu lewat determinan (LU per sistem) lalu ulangi
+        inv = np.full_like(A, np.nan)
+        aman = np.linalg.det(A) != 0
+        try:
+            inv[aman] = np.linalg.inv(A[aman])
+        except np.linalg.LinAlgError:
+            for i in np.flatnonzero(aman):
+                try:
+                    inv[i] = np.linalg.inv(A[i])
+                except np.linalg.LinAlgError:
+                    pass
+    with np.errstate(invalid='ignore', over='ignore'):
+        kondisi = _norma_1(A) * _norma_1(inv)
+        x = inv @ b
+    kondisi[~np.isfinite(kondisi)] = np.inf
+    return x, kondisi
+
+
+def selesaikan(A, b, ambang_kondisi=AMBANG_KONDISI):
+    """Selesaikan A[i] x[i] = b[i] untuk setiap i dalam satu panggilan.
+
+    A berukuran (N, n, n) atau (n, n) untuk satu sistem; b berukuran (N, n),
+    (N, n, k) atau (n,) sesuai A. Mengembalikan HasilSPL berisi x (bentuk sama
+    dengan b, NaN untuk sistem singular), kondisi (bilangan kondisi per sistem)
+    serta masker singular dan buruk (kondisi di atas ambang_kondisi).
+    Kondisi memakai norma-1: norma A dikali norma inversnya.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    tunggal = A.ndim == 2
+    if tunggal:
+        A, b = A[None], b[None]
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError(f"A harus berukuran (N, n, n), bukan {A.shape}")
+    vektor = b.ndim == 2
+    if vektor:
+        b = b[:, :, None]
+    if b.shape[:2] != A.shape[:2]:
+        raise ValueError(f"Ukuran b {b.shape} tidak cocok dengan A {A.shape}")
+
+    n = A.shape[1]
+    if n == 2:
+        x, kondisi = _tertutup(A, b, _invers_2x2)
+    elif n == 3:
+        x, kondisi = _tertutup(A, b, _invers_3x3)
+    else:
+        x, kondisi = _umum(A, b)
+    singular = kondisi >= AMBANG_SINGULAR
+    x[singular] = np.nan
+    buruk = ~singular & (kondisi > ambang_kondisi)
+
+    if vektor:
+        x = x[:, :, 0]
+    if tunggal:
+        return HasilSPL(x[0], kondisi[0], bool(singular[0]), bool(buruk[0]))
+    return HasilSPL(x, kondisi, singular, buruk)
+
+
+if __name__ == '__main__':
+    # Sistem dari Nomer_Dua: 2x + 3y = 8, 3x + 4y = 11
+    hasil = selesaikan([[2, 3], [3, 4]], [8, 11])
+    print("Solusi SPL:")
+    print("x =", hasil.x[0])
+    print("y =", hasil.x[1])
@@ -0,0 +1,235 @@
+"""Benchmark performa Aplikasi Analisis Penjualan dengan data penjualan sintetis.
+
+Contoh:
+    python benchmark_penjualan.py --skala kecil sedang -o hasil.json
+    python benchmark_penjualan.py --skala kecil -o baru.json --bandingkan hasil.json
+
+Setiap skala menghasilkan CSV sintetis (disimpan ulang di folder data), lalu
+mengukur waktu (terbaik dan median dari beberapa ulangan) dan puncak memori untuk
+pemuatan, filter, setiap agregat SalesAnalyzer, ekspor ringkasan dan grafik tanpa
+GUI. Hasil ditulis sebagai JSON sehingga bisa dibandingkan antar-run untuk
+menangkap regresi; perlambatan harus melewati batas relatif dan mutlak.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import PAD_Projek_UAS_Final as app
+
+# nama skala -> (jumlah baris, jumlah produk, rentang hari)
+SCALES = {
+    'kecil': (10_000, 7, 365),
+    'sedang': (1_000_000, 50, 3 * 365),
+    'besar': (10_000_000, 200, 5 * 365),
+    'raksasa': (50_000_000, 500, 10 * 365),
+}
+
+# Baris per tulisan saat membuat CSV agar skala besar tidak perlu muat di memori
+WRITE_CHUNK = 1_000_000
+
+ANALYZER_METHODS = ['total_sales_per_product', 'daily_income', 'monthly_sales',
+                    'monthly_income', 'income_per_product']
+
+
+def generate_csv(path, rows, products, days, seed=0):
+    """Tulis CSV penjualan sintetis dengan kolom seperti file asli."""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Sepatu {i:03d}" for i in range(products)])
+    prices = rng.integers(100, 2000, products) * 1000
+    start = np.datetime64('2020-01-01')
+    with open(path, 'w', newline='') as f:
+        f.write("Tanggal,Produk,Jumlah Terjual,Harga Satuan\n")
+        for offset in range(0, rows, WRITE_CHUNK):
+            n = min(WRITE_CHUNK, rows - offset)
+            product = rng.integers(0, products, n)
+            frame = pd.DataFrame({
+                'Tanggal': np.sort(start + rng.integers(0, days, n).astype('timedelta64[D]')),
+                'Produk': names[product],
+                'Jumlah Terjual': rng.integers(1, 10, n),
+                'Harga Satuan': prices[product],
+            })
+            frame.to_csv(f, header=False, index=False, date_format='%Y-%m-%d')
+
+
+def dataset(data_dir, scale):
+    rows, products, days = SCALES[scale]
+    path = os.path.join(data_dir, f"penjualan_{scale}.csv")
+    if not os.path.exists(path):
+        logging.info(f"Membuat data {scale} ({rows:,} baris)")
+        generate_csv(path, rows, products, days)
+    return path
+
+
+class Recorder:
+    """Mengukur langkah-langkah benchmark: waktu terbaik dan median dari beberapa ulangan, dan puncak memori.
+
+    Waktu diukur tanpa tracemalloc (yang memperlambat setiap alokasi); puncak memori
+    diambil dari satu run tambahan sesudahnya.
+    """
+
+    def __init__(self, repeat=3, memory=True):
+        self.repeat = max(1, repeat)
+        self.memory = memory
+        self.results = {}
+
+    def measure(self, name, func, rows=None):
+        times, result = [], None
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            result = func()
+            times.append(time.perf_counter() - start)
+        best = min(times)
+        entry = {'detik': round(best, 6), 'median_detik': round(statistics.median(times), 6)}
+        if self.memory:
+            tracemalloc.start()
+            try:
+                func()
+                entry['puncak_mb'] = round(tracemalloc.get_traced_memory()[1] / 1024 ** 2, 3)
+            finally:
+                tracemalloc.stop()
+        if rows is not None:
+            entry['baris'] = int(rows)
+        self.results[name] = entry
+        logging.info(f"  {name}: {best:.4f} s")
+        return result
+
+
+def run_scale(path, recorder, chunksize, charts=True):
+    handler = app.DataHandler()
+    recorder.measure('muat', lambda: handler.load_csv(path))
+    chunked = app.DataHandler()
+    recorder.measure('muat_potongan', lambda: chunked.load_csv(path, chunksize=chunksize))
+    data = handler.get_data()
+
+    dates = data['tanggal']
+    start = dates.iloc[len(dates) // 4]
+    end = dates.iloc[3 * len(dates) // 4]
+    product = handler.products()[0]
+    filtered = recorder.measure('filter_tanggal', lambda: handler.filter_by_date(start, end))
+    recorder.results['filter_tanggal']['baris'] = len(filtered)
+    recorder.measure('filter_produk', lambda: handler.filter_by_date(start, end, product))
+    recorder.measure('cari_produk', lambda: handler.search('sepatu 00'))
+
+    analyzer = app.SalesAnalyzer(data, handler.cube.frame, handler.stats)
+    raw = app.SalesAnalyzer(data)
+    for method in ANALYZER_METHODS:
+        recorder.measure(f"analisis_{method}", getattr(analyzer, method), len(data))
+        recorder.measure(f"analisis_{method}_mentah", getattr(raw, method), len(data))
+    recorder.measure('statistik_ringkasan', lambda: app.SummaryStats.from_frame(data, cube=handler.cube.frame))
+    recorder.measure('ringkasan_teks', lambda: app.MainAppGUI.summary_text(handler.stats))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = app.SalesStore(os.path.join(tmp, 'penjualan.sqlite'))
+        recorder.measure('muat_sqlite', lambda: store.load_csv(path, chunksize=chunksize))
+        query = store.query().where(start, end)
+        recorder.measure('sqlite_filter_tanggal', lambda: query.collect().window(0, 50))
+        recorder.measure('sqlite_filter_produk', lambda: store.query().where(start, end, product).count())
+        recorder.measure('sqlite_pendapatan_harian', lambda: query.aggregate('daily_income').collect())
+        recorder.measure('sqlite_ringkasan', query.summary)
+
+        recorder.measure('ekspor_ringkasan', lambda: analyzer.export_summary(os.path.join(tmp, 'ringkasan.csv')))
+        recorder.measure('ekspor_ringkasan_lengkap',
+                         lambda: analyzer.export_summary(os.path.join(tmp, 'lengkap.csv'), extended=True))
+        if charts:
+            surface = app.ChartSurface()
+            for name, (method, kind, title) in app.ReportEngine.CHARTS.items():
+                series = getattr(analyzer, method)()
+                recorder.measure(f"grafik_{name}",
+                                 lambda: analyzer.draw_plot(series, kind, title, surface).savefig(
+                                     os.path.join(tmp, f"{name}.png")))
+
+
+def compare(current, baseline, threshold, min_delta=0.005, statistic='detik'):
+    """Daftar langkah yang melambat lebih dari threshold (rasio) dan min_delta detik dibanding baseline.
+
+    statistic memilih waktu yang dibandingkan: 'detik' (terbaik dari ulangan) atau
+    'median_detik'. Batas selisih mutlak mencegah langkah yang hanya beberapa
+    milidetik dianggap regresi karena derau pengukuran.
+    """
+    regressions = []
+    for scale, steps in current['hasil'].items():
+        for step, entry in steps.items():
+            old = baseline.get('hasil', {}).get(scale, {}).get(step)
+            # Hasil lama tanpa median dibandingkan dengan waktu terbaiknya
+            key = statistic if old and statistic in old and statistic in entry else 'detik'
+            if not old or not old[key]:
+                continue
+            ratio = entry[key] / old[key]
+            if ratio > 1 + threshold and entry[key] - old[key] > min_delta:
+                regressions.append((scale, step, old[key], entry[key], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Aplikasi Analisis Penjualan")
+    parser.add_argument('--skala', nargs='+', default=['kecil', 'sedang'], choices=list(SCALES),
+                        help="skala data yang diukur")
+    parser.add_argument('--data', default=os.path.join(tempfile.gettempdir(), 'pad_benchmark'),
+                        help="folder CSV sintetis (dipakai ulang antar-run)")
+    parser.add_argument('-o', '--output', default='benchmark.json', help="file hasil JSON")
+    parser.add_argument('--ulang', type=int, default=3, help="ulangi tiap langkah; waktu terbaik dan median disimpan")
+    parser.add_argument('--chunksize', type=int, default=app.STREAM_CHUNKSIZE,
+                        help="ukuran potongan untuk muat_potongan")
+    parser.add_argument('--tanpa-memori', action='store_true',
+                        help="lewati run tambahan dengan tracemalloc untuk puncak memori")
+    parser.add_argument('--tanpa-grafik', action='store_true', help="lewati pengukuran grafik")
+    parser.add_argument('--bandingkan', help="file JSON hasil sebelumnya sebagai pembanding")
+    parser.add_argument('--ambang', type=float, default=0.2,
+                        help="batas perlambatan relatif sebelum dianggap regresi")
+    parser.add_argument('--selisih-minimum', type=float, default=0.005,
+                        help="perlambatan mutlak minimum (detik) sebelum dianggap regresi")
+    parser.add_argument('--statistik', choices=['terbaik', 'median'], default='terbaik',
+                        help="waktu ulangan yang dibandingkan")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    os.makedirs(args.data, exist_ok=True)
+    if not args.tanpa_grafik:
+        import matplotlib
+        matplotlib.use('Agg')
+        app.apply_theme()
+
+    report = {
+        'waktu': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'mesin': platform.machine(),
+        'hasil': {},
+    }
+    for scale in args.skala:
+        path = dataset(args.data, scale)
+        logging.info(f"Skala {scale}: {path}")
+        recorder = Recorder(args.ulang, memory=not args.tanpa_memori)
+        run_scale(path, recorder, args.chunksize, charts=not args.tanpa_grafik)
+        report['hasil'][scale] = recorder.results
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    logging.info(f"Hasil ditulis ke {args.output}")
+
+    if args.bandingkan:
+        with open(args.bandingkan) as f:
+            baseline = json.load(f)
+        statistic = 'detik' if args.statistik == 'terbaik' else 'median_detik'
+        regressions = compare(report, baseline, args.ambang, args.selisih_minimum, statistic)
+        for scale, step, old, new, ratio in regressions:
+            print(f"REGRESI {scale}/{step}: {old:.4f} s -> {new:.4f} s ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print("Tidak ada regresi")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,47 @@
+import os
+import sys
+
+import matplotlib
+import pandas as pd
+import pytest
+
+matplotlib.use('Agg')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# Modul di Pad/ saling mengimpor sebagai skrip (import spl), bukan sebagai paket
+sys.path.insert(0, os.path.join(ROOT, 'Pad'))
+
+import PAD_Projek_UAS_Final as app  # noqa: E402 - setelah backend Agg dan sys.path
+
+
+def sales_rows(days=40, products=('Sepatu A', 'Sepatu B', 'Sandal C'), start='2024-01-01'):
+    """Baris penjualan kecil yang deterministik, dengan beberapa baris per hari."""
+    rows = []
+    for day, date in enumerate(pd.date_range(start, periods=days, freq='D')):
+        for i, product in enumerate(products):
+            if (day + i) % 4 == 3:
+                continue
+            rows.append((date.strftime('%Y-%m-%d'), product, (day * 7 + i * 3) % 9 + 1, 1000 * (i + 1) * (day % 5 + 1)))
+    return rows
+
+
+def write_csv(path, rows, header=True):
+    with open(path, 'w', newline='') as f:
+        if header:
+            f.write("Tanggal,Produk,Jumlah Terjual,Harga Satuan\n")
+        for row in rows:
+            f.write(",".join(str(value) for value in row) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def sales_csv(tmp_path):
+    return write_csv(tmp_path / 'penjualan.csv', sales_rows())
+
+
+@pytest.fixture
+def store(tmp_path, sales_csv):
+    """SalesStore yang dimuat dari sales_csv per potongan kecil."""
+    store = app.SalesStore(str(tmp_path / 'penjualan.db'))
+    assert store.load_csv(sales_csv, chunksize=25)
+    return store
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
+import PAD_Projek_UAS_Final as app
+
+
+def gui(handler):
+    """Pengganti MainAppGUI secukupnya untuk run_view_task, tanpa Tk."""
+    submitted = []
+    view = SimpleNamespace(data=pd.DataFrame({'x': [1]}))
+    return SimpleNamespace(
+        data_handler=handler,
+        view_key=lambda all_rows=False: (None, None, None, '', handler.version),
+        build_view=lambda handler, key: view,
+        view_query=lambda handler, key: None,
+        run_task=lambda channel, job, done: submitted.append((channel, job, done)),
+        submitted=submitted,
+    )
+
+
+def run(window):
+    channel, job, done = window.submitted.pop()
+    assert channel == 'analisis'
+    done(job(None))
+
+
+def test_stale_analysis_is_not_rendered(sales_csv):
+    handler = app.DataHandler()
+    assert handler.load_csv(sales_csv)
+    window = gui(handler)
+    drawn = []
+    render = lambda view, value: drawn.append(value)
+
+    app.MainAppGUI.run_view_task(window, lambda query: 'hasil', render)
+    run(window)
+    assert drawn == ['hasil']
+
+    # Data diganti sebelum analisis selesai
+    app.MainAppGUI.run_view_task(window, lambda query: 'lama', render)
+    replaced = app.DataHandler()
+    assert replaced.load_csv(sales_csv)
+    window.data_handler = replaced
+    run(window)
+
+    # Data yang sama mendapat versi baru (misalnya baris tambahan dari mode tail)
+    window.data_handler = handler
+    app.MainAppGUI.run_view_task(window, lambda query: 'lama', render)
+    handler.set_data(handler.get_data())
+    run(window)
+    assert drawn == ['hasil']
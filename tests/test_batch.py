@@ -0,0 +1,21 @@
+import os
+
+import PAD_Projek_UAS_Final as app
+from conftest import sales_rows, write_csv
+
+
+def test_csv_paths_folder_glob_and_no_match(tmp_path):
+    first = write_csv(tmp_path / 'a.csv', sales_rows(5))
+    second = write_csv(tmp_path / 'b.csv', sales_rows(5))
+    assert app.csv_paths(str(tmp_path)) == [first, second]
+    assert app.csv_paths(str(tmp_path / '*.csv')) == [first, second]
+    assert app.csv_paths([first, str(tmp_path / 'tidak_ada*.csv')]) == [first]
+    assert app.csv_paths(str(tmp_path / 'tidak_ada.csv')) == []
+
+
+def test_main_reports_unmatched_pattern(tmp_path, sales_csv):
+    output = tmp_path / 'laporan'
+    code = app.main([sales_csv, str(tmp_path / 'tidak_ada*.csv'), '-o', str(output),
+                     '--tanpa-grafik', '--tanpa-cache'])
+    assert code == 1
+    assert os.listdir(output) == ['penjualan_ringkasan.csv']
@@ -0,0 +1,39 @@
+import tracemalloc
+
+import benchmark_penjualan as bench
+
+
+def result(**steps):
+    return {'hasil': {'kecil': {name: {'detik': best, 'median_detik': median}
+                                for name, (best, median) in steps.items()}}}
+
+
+def test_timed_runs_are_not_traced():
+    traced = []
+    recorder = bench.Recorder(repeat=3, memory=True)
+    recorder.measure('langkah', lambda: traced.append(tracemalloc.is_tracing()))
+
+    # Tiga run berwaktu tanpa tracemalloc, lalu satu run terpisah untuk puncak memori
+    assert traced == [False, False, False, True]
+    entry = recorder.results['langkah']
+    assert entry['detik'] <= entry['median_detik']
+    assert 'puncak_mb' in entry
+
+
+def test_compare_ignores_small_absolute_changes():
+    baseline = result(cepat=(0.001, 0.001), lambat=(1.0, 1.0))
+    current = result(cepat=(0.003, 0.003), lambat=(1.5, 1.5))
+
+    regressions = bench.compare(current, baseline, threshold=0.2, min_delta=0.005)
+    assert [step for _, step, *_ in regressions] == ['lambat']
+
+
+def test_compare_statistic():
+    baseline = result(langkah=(1.0, 1.0))
+    current = result(langkah=(1.0, 2.0))
+
+    assert bench.compare(current, baseline, 0.2) == []
+    assert len(bench.compare(current, baseline, 0.2, statistic='median_detik')) == 1
+    # Hasil lama tanpa median dibandingkan dengan waktu terbaik
+    del baseline['hasil']['kecil']['langkah']['median_detik']
+    assert bench.compare(current, baseline, 0.2, statistic='median_detik') == []
@@ -0,0 +1,27 @@
+import pandas as pd
+
+import PAD_Projek_UAS_Final as app
+
+
+def test_line_redraw_without_markers():
+    # Seri panjang digambar tanpa penanda (marker=None); gambar ulang memakai Line2D yang sama
+    surface = app.ChartSurface()
+    analyzer = app.SalesAnalyzer(None)
+    index = pd.date_range('2024-01-01', periods=app.LOD_MARKER_POINTS + 20, freq='D', name='tanggal')
+    series = pd.Series(range(len(index)), index=index, dtype='float64')
+    analyzer.draw_plot(series, 'line', 'Pendapatan', surface)
+    line = surface.artists['line']
+    analyzer.draw_plot(series * 2, 'line', 'Pendapatan', surface)
+    assert surface.artists['line'] is line
+    assert line.get_marker() in ('', 'None')
+    assert list(line.get_ydata()) == list(series * 2)
+
+
+def test_evicted_page_figure_is_cleared():
+    surface = app.ChartSurface()
+    first, _ = surface.axes('halaman_0')
+    figure = first.figure
+    for i in range(1, app.ChartSurface.MAX_PAGES + 2):
+        surface.axes(f"halaman_{i}")
+    assert 'halaman_0' not in surface._pages
+    assert figure.axes == []
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+import matriks
+
+# Termasuk ukuran di sekitar batas blok (BLOK = 64) dan matriks tidak persegi
+SHAPES = [(1, 1, 1), (2, 3, 4), (5, 1, 7), (63, 64, 65), (70, 65, 130)]
+
+
+def random_lists(rng, rows, cols):
+    return rng.normal(size=(rows, cols)).tolist()
+
+
+@pytest.mark.parametrize('n, m, p', SHAPES)
+@pytest.mark.parametrize('func', [matriks.kali_naif, matriks.kali_blok, matriks.kali])
+def test_matches_matmul(func, n, m, p):
+    rng = np.random.default_rng(n * m * p)
+    A, B = random_lists(rng, n, m), random_lists(rng, m, p)
+    result = func(A, B)
+    assert isinstance(result, list)
+    np.testing.assert_allclose(np.array(result), np.array(A) @ np.array(B), rtol=1e-12, atol=1e-12)
+
+
+def test_small_blocks_cover_partial_edges():
+    rng = np.random.default_rng(1)
+    A, B = random_lists(rng, 7, 10), random_lists(rng, 10, 9)
+    np.testing.assert_allclose(np.array(matriks.kali_blok(A, B, blok=4)), np.array(A) @ np.array(B))
+
+
+def test_kali_dispatch(monkeypatch):
+    A, B = [[1, 2], [3, 4]], [[5, 6], [7, 8]]
+    assert matriks.kali(A, B) == [[19, 22], [43, 50]]
+    result = matriks.kali(np.array(A), np.array(B))
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_array_equal(result, [[19, 22], [43, 50]])
+
+    calls = []
+    monkeypatch.setattr(matriks, 'np', None)
+    monkeypatch.setattr(matriks, 'kali_blok', lambda A, B: calls.append('blok'))
+    monkeypatch.setattr(matriks, 'kali_naif', lambda A, B: calls.append('naif'))
+    big = [[1.0] * 40 for _ in range(40)]
+    matriks.kali(A, B)
+    matriks.kali(big, big)
+    assert calls == ['naif', 'blok']
+
+
+def test_kali_batch():
+    rng = np.random.default_rng(2)
+    As = rng.normal(size=(5, 3, 4))
+    Bs = rng.normal(size=(5, 4, 2))
+    np.testing.assert_allclose(matriks.kali_batch(As, Bs), As @ Bs)
+    result = matriks.kali_batch(As.tolist(), Bs[0].tolist())
+    assert isinstance(result, list)
+    np.testing.assert_allclose(np.array(result), As @ Bs[0])
+
+
+def test_kali_batch_without_numpy(monkeypatch):
+    rng = np.random.default_rng(3)
+    As = rng.normal(size=(4, 3, 5))
+    Bs = rng.normal(size=(4, 5, 2))
+    monkeypatch.setattr(matriks, 'np', None)
+    np.testing.assert_allclose(np.array(matriks.kali_batch(As.tolist(), Bs.tolist())), As @ Bs)
+    # Satu B dipakai untuk semua A
+    np.testing.assert_allclose(np.array(matriks.kali_batch(As.tolist(), Bs[0].tolist())), As @ Bs[0])
+    with pytest.raises(ValueError):
+        matriks.kali_batch(As.tolist(), Bs[:3].tolist())
+    with pytest.raises(ImportError):
+        matriks.kali_numpy(As[0], Bs[0])
+
+
+def test_shape_errors():
+    with pytest.raises(ValueError, match="Ukuran tidak cocok"):
+        matriks.kali([[1, 2, 3]], [[1, 2], [3, 4]])
+    with pytest.raises(ValueError, match="Panjang baris"):
+        matriks.kali_naif([[1, 2], [3]], [[1], [2]])
+    with pytest.raises(ValueError, match="Ukuran tidak cocok"):
+        matriks.kali_blok([[1.0, 2.0]], [[1.0, 2.0]])
@@ -0,0 +1,110 @@
+import pandas as pd
+import pytest
+
+import PAD_Projek_UAS_Final as app
+from conftest import sales_rows, write_csv
+
+AGGREGATES = ['total_sales_per_product', 'income_per_product', 'daily_income', 'monthly_income']
+
+
+def rows_of(data):
+    """Isi DataFrame tanpa memandang urutan baris, untuk membandingkan cara pemuatan."""
+    frame = data[['tanggal', 'produk', 'jumlah_terjual', 'harga_satuan', 'pendapatan']].copy()
+    frame['produk'] = frame['produk'].astype(str)
+    return frame.sort_values(list(frame.columns)).reset_index(drop=True)
+
+
+def plain(series):
+    """Series dengan indeks biasa (bukan kategori) agar hasil agregat SQLite dan pandas bisa dibandingkan."""
+    return pd.Series(series.to_numpy(), index=pd.Index(list(series.index), dtype=object))
+
+
+def assert_same_load(handler, expected):
+    pd.testing.assert_frame_equal(rows_of(handler.get_data()), rows_of(expected.get_data()))
+    pd.testing.assert_frame_equal(handler.cube.frame.reset_index(drop=True),
+                                  expected.cube.frame.reset_index(drop=True), check_categorical=False)
+    assert handler.stats.count == expected.stats.count
+    assert handler.stats.mean == pytest.approx(expected.stats.mean)
+    assert handler.stats.std == pytest.approx(expected.stats.std)
+    assert handler.stats.total_income == expected.stats.total_income
+    assert handler.products() == expected.products()
+
+
+@pytest.fixture
+def loaded(sales_csv):
+    handler = app.DataHandler()
+    assert handler.load_csv(sales_csv)
+    return handler
+
+
+def test_chunked_load_matches_one_shot(sales_csv, loaded):
+    chunked = app.DataHandler()
+    assert chunked.load_csv(sales_csv, chunksize=17)
+    assert_same_load(chunked, loaded)
+
+
+def test_load_many_matches_one_shot(tmp_path, loaded):
+    rows = sales_rows()
+    folder = tmp_path / 'folder'
+    folder.mkdir()
+    write_csv(folder / 'a.csv', rows[:40])
+    write_csv(folder / 'b.csv', rows[40:])
+
+    many = app.DataHandler()
+    assert many.load_many(str(folder), workers=1)
+    assert many.skipped_files == []
+    assert_same_load(many, loaded)
+
+
+def test_cache_roundtrip_and_invalidation(tmp_path, monkeypatch, sales_csv, loaded):
+    pytest.importorskip('pyarrow')
+    cache = app.DataCache(str(tmp_path / 'cache'))
+    first = app.DataHandler(cache=cache)
+    assert first.load_csv(sales_csv)
+    assert cache.get(sales_csv) is not None
+
+    cached = app.DataHandler(cache=cache)
+    assert cached.load_csv(sales_csv)
+    assert_same_load(cached, loaded)
+
+    # Format frame di cache berubah: entri versi lain tidak dipakai
+    monkeypatch.setattr(app, 'CACHE_VERSION', app.CACHE_VERSION + 1)
+    assert cache.get(sales_csv) is None
+    assert app.DataHandler(cache=cache).load_csv(sales_csv)
+    assert cache.get(sales_csv) is not None
+
+    # CSV berubah: entri lama tidak boleh dipakai lagi
+    write_csv(sales_csv, sales_rows(days=45))
+    assert cache.get(sales_csv) is None
+    reloaded = app.DataHandler(cache=cache)
+    assert reloaded.load_csv(sales_csv)
+    assert len(reloaded.get_data()) == len(sales_rows(days=45))
+
+
+@pytest.mark.parametrize('start, end, product', [
+    (None, None, None),
+    ('2024-01-05', '2024-01-20', None),
+    ('2024-01-05', '2024-01-20', 'Sandal C'),
+    ('2024-02-01', '2024-01-01', None),
+])
+def test_store_queries_match_handler(store, loaded, start, end, product):
+    start = start and pd.Timestamp(start)
+    end = end and pd.Timestamp(end)
+    expected = loaded.query().where(start, end, product)
+    query = store.query().where(start, end, product)
+
+    assert query.count() == expected.count()
+    view = query.collect()
+    assert len(view) == len(expected.collect())
+    # SQLite mengembalikan tipe lebar (int64, datetime detik); yang dibandingkan nilainya
+    pd.testing.assert_frame_equal(rows_of(view.to_frame()), rows_of(expected.collect()), check_dtype=False)
+    for name in AGGREGATES:
+        pd.testing.assert_series_equal(plain(query.aggregate(name).collect()),
+                                       plain(expected.aggregate(name).collect()), check_dtype=False)
+
+    stats, reference = query.summary(), expected.summary()
+    assert stats.count == reference.count
+    if reference.count:
+        assert stats.mean == pytest.approx(reference.mean)
+        assert stats.std == pytest.approx(reference.std)
+        assert stats.total_income == reference.total_income
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+import spl
+
+
+def systems(n, count=6, seed=0):
+    rng = np.random.default_rng(seed)
+    # Diagonal dominan: berkondisi baik
+    A = rng.normal(size=(count, n, n)) + n * np.eye(n)
+    b = rng.normal(size=(count, n))
+    return A, b
+
+
+@pytest.mark.parametrize('n', [1, 2, 3, 4, 6])
+def test_matches_numpy_solve(n):
+    A, b = systems(n)
+    hasil = spl.selesaikan(A, b)
+    np.testing.assert_allclose(hasil.x, np.linalg.solve(A, b[:, :, None])[:, :, 0], rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(hasil.kondisi, np.linalg.cond(A, 1), rtol=1e-8)
+    assert not hasil.singular.any() and not hasil.buruk.any()
+
+
+@pytest.mark.parametrize('n', [2, 3, 5])
+def test_singular_and_ill_conditioned_systems_are_flagged(n):
+    A, b = systems(n, seed=n)
+    # Sistem 1 tepat singular (dua baris sama), sistem 2 berkondisi buruk
+    A[1] = np.arange(1, n * n + 1, dtype=float).reshape(n, n)
+    A[1, 1] = A[1, 0]
+    A[2] = np.eye(n)
+    A[2, -1, -1] = 1e-13
+    hasil = spl.selesaikan(A, b)
+
+    assert hasil.singular.tolist() == [False, True, False, False, False, False]
+    assert hasil.buruk.tolist() == [False, False, True, False, False, False]
+    assert np.isnan(hasil.x[1]).all()
+    assert np.isinf(hasil.kondisi[1])
+    assert hasil.kondisi[2] > spl.AMBANG_KONDISI
+    good = [0, 2, 3, 4, 5]
+    np.testing.assert_allclose(hasil.x[good], np.linalg.solve(A[good], b[good][:, :, None])[:, :, 0], rtol=1e-8)
+
+
+def test_single_system():
+    hasil = spl.selesaikan([[2, 3], [3, 4]], [8, 11])
+    np.testing.assert_allclose(hasil.x, [1, 2])
+    assert np.ndim(hasil.kondisi) == 0
+    assert hasil.singular is False and hasil.buruk is False
+
+    singular = spl.selesaikan([[1, 2], [2, 4]], [1, 2])
+    assert singular.singular is True
+    assert np.isnan(singular.x).all()
+
+
+@pytest.mark.parametrize('n', [2, 3, 4])
+def test_several_right_hand_sides(n):
+    A, _ = systems(n)
+    b = np.random.default_rng(1).normal(size=(len(A), n, 3))
+    hasil = spl.selesaikan(A, b)
+    assert hasil.x.shape == b.shape
+    np.testing.assert_allclose(hasil.x, np.linalg.solve(A, b), rtol=1e-10, atol=1e-12)
+
+
+def test_shape_errors():
+    with pytest.raises(ValueError, match="A harus"):
+        spl.selesaikan(np.ones((2, 2, 3)), np.ones((2, 2)))
+    with pytest.raises(ValueError, match="tidak cocok"):
+        spl.selesaikan(np.ones((2, 3, 3)), np.ones((2, 2)))
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import PAD_Projek_UAS_Final as app
+from conftest import sales_rows, write_csv
+
+QUANTILES = [0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def frame(seed, rows):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'tanggal': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 60, rows), unit='D'),
+        'produk': rng.choice(['A', 'B', 'C'], rows),
+        'jumlah_terjual': rng.integers(1, 10, rows),
+        'harga_satuan': rng.integers(1, 500, rows) * 1000,
+    })
+    return app.derive_columns(df)
+
+
+def assert_same_stats(merged, expected):
+    assert merged.count == expected.count
+    assert merged.mean == pytest.approx(expected.mean)
+    assert merged.std == pytest.approx(expected.std)
+    assert merged.minimum == expected.minimum and merged.maximum == expected.maximum
+    assert merged.start == expected.start and merged.end == expected.end
+    assert merged.total_units == expected.total_units
+    assert merged.total_income == expected.total_income
+    assert merged.sketch is not None
+    for q in QUANTILES:
+        assert merged.quantile(q) == pytest.approx(expected.quantile(q), rel=2 * app.SKETCH_ACCURACY)
+
+
+@pytest.mark.parametrize('parts', [2, 3, 5])
+def test_merge_matches_concatenated_frame(parts):
+    chunks = [frame(seed, 200 + 50 * seed) for seed in range(parts)]
+    expected = app.SummaryStats.from_frame(pd.concat(chunks))
+
+    # Mulai dari SummaryStats() kosong, seperti pembaca per potongan
+    merged = app.SummaryStats()
+    for chunk in chunks:
+        merged = merged.merge(app.SummaryStats.from_frame(chunk))
+    assert_same_stats(merged, expected)
+    assert_same_stats(app.SummaryStats.combine([app.SummaryStats.from_frame(c) for c in chunks]), expected)
+
+
+def test_quantiles_within_sketch_accuracy():
+    data = frame(7, 2000)
+    stats = app.SummaryStats.from_frame(data)
+    values = data['pendapatan'].to_numpy(dtype='float64')
+    for q in QUANTILES:
+        assert stats.quantile(q) == pytest.approx(np.quantile(values, q), rel=2 * app.SKETCH_ACCURACY)
+    assert stats.minimum <= stats.quantile(0.99) <= stats.maximum
+
+
+def test_chunked_and_parallel_loads_keep_quantiles(tmp_path):
+    path = write_csv(tmp_path / 'penjualan.csv', sales_rows(60))
+    one_shot = app.DataHandler()
+    assert one_shot.load_csv(path)
+    chunked = app.DataHandler()
+    assert chunked.load_csv(path, chunksize=17)
+    parallel = app.DataHandler()
+    assert parallel.load_many([path], workers=1)
+    for handler in (chunked, parallel):
+        assert_same_stats(handler.stats, one_shot.stats)
@@ -0,0 +1,74 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+import PAD_Projek_UAS_Final as app
+from conftest import sales_rows, write_csv
+
+
+def test_stats_stored_as_json(store):
+    conn = sqlite3.connect(store.path)
+    text = dict(conn.execute("SELECT kunci, nilai FROM meta").fetchall())['statistik']
+    conn.close()
+    assert isinstance(text, str)
+    json.loads(text)
+
+    reopened = app.SalesStore(store.path)
+    assert reopened.last_error is None
+    frame = app.SalesAnalyzer.summary_frame
+    assert frame(reopened.stats, extended=True).equals(frame(store.stats, extended=True))
+
+
+def test_unknown_stats_format_is_not_loaded(store):
+    conn = sqlite3.connect(store.path)
+    conn.execute("UPDATE meta SET nilai = ? WHERE kunci = 'statistik'", [b'\x80\x04pickle'])
+    conn.commit()
+    conn.close()
+
+    reopened = app.SalesStore(store.path)
+    assert reopened.stats is None
+    assert reopened.get_data() is None
+    assert 'buat ulang' in reopened.last_error
+
+
+def test_reload_closes_connections_of_other_stores(tmp_path, store):
+    other = app.SalesStore(store.path)
+    assert len(other.get_data().window(0, 5)) == 5
+    sorted_view = other.get_data().sorted('harga_satuan').prepare()
+
+    path = write_csv(tmp_path / 'baru.csv', sales_rows(days=10, products=('Topi D',)))
+    assert store.load_csv(path)
+    assert not os.path.exists(store.path + '.tmp')
+    del sorted_view
+
+    other.open()
+    assert len(other.get_data()) == len(store.get_data())
+    assert other.products() == ['Topi D']
+
+
+@pytest.mark.parametrize('col, reverse', [('harga_satuan', True), ('produk', False), ('jumlah_terjual', False)])
+def test_sorted_windows_match_frame_sort(store, col, reverse):
+    frame = store.get_data().to_frame()
+    expected = frame.sort_values(col, ascending=not reverse, kind='stable').reset_index(drop=True)
+
+    view = store.get_data().sorted(col, reverse)
+    for start in (0, 7, len(view) // 2, len(view) - 3):
+        window = view.window(start, start + 10)
+        part = expected.iloc[start:start + 10].reset_index(drop=True)
+        assert window[col].tolist() == part[col].tolist()
+        assert window['tanggal'].tolist() == part['tanggal'].tolist()
+
+
+def test_product_filter_window(store, sales_csv):
+    handler = app.DataHandler()
+    assert handler.load_csv(sales_csv)
+    start, end = app.pd.Timestamp('2024-01-05'), app.pd.Timestamp('2024-01-25')
+    expected = handler.filter_by_date(start, end, 'Sepatu B').reset_index(drop=True)
+
+    view = store.filter_by_date(start, end, 'Sepatu B')
+    assert len(view) == len(expected)
+    window = view.window(3, 9)
+    assert window['tanggal'].tolist() == expected['tanggal'].iloc[3:9].tolist()
+    assert window['harga_satuan'].tolist() == expected['harga_satuan'].iloc[3:9].tolist()
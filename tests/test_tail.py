@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import PAD_Projek_UAS_Final as app
+from conftest import sales_rows, write_csv
+
+HEADER = "Tanggal,Produk,Jumlah Terjual,Harga Satuan\n"
+
+
+def append(path, text):
+    with open(path, 'a', newline='') as f:
+        f.write(text)
+
+
+@pytest.mark.parametrize('chunksize', [None, 1])
+def test_last_line_without_newline_is_loaded(tmp_path, chunksize):
+    path = tmp_path / 'tanpa_baris_baru.csv'
+    path.write_text(HEADER + "2024-01-01,A,1,1000\n2024-01-02,B,2,2000")
+    handler = app.DataHandler()
+    assert handler.load_csv(str(path), chunksize=chunksize)
+    assert handler.get_data()['harga_satuan'].tolist() == [1000, 2000]
+
+    store = app.SalesStore(str(tmp_path / 'penjualan.db'))
+    assert store.load_csv(str(path))
+    assert len(store.get_data()) == 2
+
+    # Pantau File dinyalakan belakangan: baris terakhir yang sudah dimuat tidak diulang
+    append(path, "\n2024-01-03,C,3,3000\n")
+    assert handler.append_rows(handler.read_new_rows()) == 1
+    assert handler.get_data()['produk'].astype(str).tolist() == ['A', 'B', 'C']
+
+
+@pytest.mark.parametrize('chunksize', [None, 1])
+def test_header_without_newline_is_empty(tmp_path, chunksize):
+    path = tmp_path / 'header.csv'
+    path.write_text(HEADER.rstrip("\n"))
+    handler = app.DataHandler()
+    assert handler.load_csv(str(path), chunksize=chunksize)
+    assert handler.get_data().empty
+
+
+@pytest.mark.parametrize('chunksize', [None, 1])
+def test_partial_last_line_is_read_once(tmp_path, chunksize):
+    path = tmp_path / 'sebagian.csv'
+    path.write_text(HEADER + "2024-01-01,A,1,1000\n2024-01-02,B,2,25")
+    handler = app.DataHandler()
+    assert handler.load_csv(str(path), chunksize=chunksize, follow=True)
+    assert len(handler.get_data()) == 1
+    assert handler._tail_offset == len(HEADER + "2024-01-01,A,1,1000\n")
+
+    # Penulis menyelesaikan baris terakhir: baris itu dibaca utuh, bukan dua kali
+    append(path, "0000\n")
+    assert handler.append_rows(handler.read_new_rows()) == 1
+    data = handler.get_data()
+    assert sorted(data['harga_satuan'].tolist()) == [1000, 250000]
+    assert handler.stats.count == 2
+    assert handler._tail_offset == path.stat().st_size
+
+
+def test_tail_skips_duplicates_and_waits_for_newline(tmp_path):
+    path = write_csv(tmp_path / 'tail.csv', sales_rows(10))
+    handler = app.DataHandler()
+    assert handler.load_csv(path)
+    rows = len(handler.get_data())
+    first = ",".join(str(value) for value in sales_rows(10)[0])
+
+    # Baris lama (duplikat) dan baris baru yang belum diakhiri baris baru
+    append(path, first + "\n2024-03-01,Sepatu A,3,5000\n2024-03-01,Sepatu B,1,")
+    assert handler.append_rows(handler.read_new_rows()) == 1
+    assert len(handler.get_data()) == rows + 1
+
+    append(path, "7000\n2024-03-01,Sepatu A,3,5000\n")
+    assert handler.append_rows(handler.read_new_rows()) == 1
+    assert handler.append_rows(handler.read_new_rows()) == 0
+    assert len(handler.get_data()) == rows + 2
+
+
+def test_appended_cube_matches_rebuild(tmp_path):
+    path = write_csv(tmp_path / 'tail.csv', sales_rows(30))
+    handler = app.DataHandler()
+    assert handler.load_csv(path)
+    last = handler.get_data()['tanggal'].max()
+    for step, product in enumerate(['Sepatu A', 'Produk Baru', 'Sandal C', 'Produk Baru 2']):
+        date = (last + pd.Timedelta(days=step // 2)).strftime('%Y-%m-%d')
+        append(path, f"{date},{product},{step + 1},{1000 * (step + 2)}\n{date},Sepatu B,1,{500 * (step + 1)}\n")
+        assert handler.append_rows(handler.read_new_rows()) == 2
+
+    rebuilt = app.SalesCube.from_data(handler.get_data())
+    pd.testing.assert_frame_equal(handler.cube.frame, rebuilt.frame)
+    for product, rows in rebuilt._product_rows.items():
+        assert np.array_equal(handler.cube._product_rows[product], rows)
+    found = handler.query().where(keyword='baru').from_cube().collect()
+    assert list(found['produk'].unique()) == ['Produk Baru', 'Produk Baru 2']
+    expected = app.SummaryStats.from_frame(handler.get_data())
+    assert handler.stats.count == expected.count
+    assert handler.stats.mean == pytest.approx(expected.mean)
+    assert handler.stats.std == pytest.approx(expected.std)
+
+
+@pytest.mark.parametrize('date', ['2024-03-01', '2024-01-05'])
+def test_query_keeps_state_across_append(tmp_path, date):
+    path = write_csv(tmp_path / 'tail.csv', sales_rows(30))
+    handler = app.DataHandler()
+    assert handler.load_csv(path)
+    query = handler.query().where(product='Sepatu A')
+    before = query.collect().copy()
+    state = handler.state
+
+    # Berurutan (tanggal baru) dan tidak berurutan (data disusun ulang)
+    append(path, f"{date},Sepatu A,4,9000\n")
+    assert handler.append_rows(handler.read_new_rows()) == 1
+    assert handler.state is not state
+    pd.testing.assert_frame_equal(query.collect(), before)
+    assert query.from_cube().collect()['jumlah_terjual'].sum() == before['jumlah_terjual'].sum()
+    assert len(handler.query().where(product='Sepatu A').collect()) == len(before) + 1
+
+
+def test_cancel_keeps_tail_channel():
+    runner = app.TaskRunner.__new__(app.TaskRunner)
+    runner.on_idle = None
+    tail, load = app.TaskProgress(), app.TaskProgress()
+    runner._tasks = {'pantau': (1, tail), 'muat': (2, load)}
+    runner.cancel(keep=('pantau',))
+    assert list(runner._tasks) == ['pantau']
+    assert load.cancelled.is_set() and not tail.cancelled.is_set()